@@ -11,28 +11,67 @@ Manages all font conversion pipeline in one GUI:
 
 import tkinter as tk
 import customtkinter as ctk
-from tkinter import filedialog
 import subprocess
 import os
 import json
 import sys
+import hashlib
+import mmap
+import shutil
 from pathlib import Path
 import threading
-from datetime import datetime
+import queue
+import asyncio
+import time
+
+try:
+    import orjson   # optional, faster JSON parsing/serialisation
+except ImportError:
+    orjson = None
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
-# Import local modules
-try:
-    from json_to_xml import XMLGenerator
-    from l_merge_libraries import merge_xml_libraries_ordered
-    import coordinate_comparator
-except ImportError as e:
-    print(f"Module import failed: {e}")
-    XMLGenerator = None
-    merge_xml_libraries_ordered = None
-    coordinate_comparator = None
+ATLAS_CACHE_DIR = '.mtsdf_cache'   # step 1 outputs, keyed by _atlas_fingerprint()
+ATLAS_CACHE_MAX_ENTRIES = 8        # cached atlases kept; least recently used are deleted
+STAGING_DIR     = '.staging'       # per-step scratch folder inside output_dir
+LIBRARY_STAMP   = '.stamp'         # step 2 skip key, inside generated_library/
+NODE_STAMP      = '.node_stamp'    # step 3 skip key, next to node.xml
+
+# Files written by XMLGenerator.generate_libraries() and read by the merge
+GENERATED_LIBRARIES = tuple(f"LIBRARY_{t}.xml" for t in (
+    'RENDERINTERFACEBOUND', 'SEGMENTSET', 'NODE', 'SHADERINSTANCE',
+    'SHADERGROUP', 'NEGLYPHMETRICS', 'NEFONTMETRICS'))
+
+# texconv arguments per DDS format (format + mip levels + encoder options)
+DDS_FORMATS = {
+    'R8G8B8A8_UNORM': ['-f', 'R8G8B8A8_UNORM', '-m', '1'],              # uncompressed, no mips
+    # EXPERIMENTAL, not verified in game: the sRGB format makes the game sRGB-decode the linear
+    # MTSDF distances, and the mip chain blends distances of neighbouring glyphs in the atlas
+    'BC7_UNORM_SRGB': ['-f', 'BC7_UNORM_SRGB', '-m', '0', '-bc', 'x'],  # 8x smaller, full mip chain
+}
+EXPERIMENTAL_DDS_FORMATS = {'BC7_UNORM_SRGB'}
+
+LOG_FLUSH_MS  = 50     # log queue drain interval (~20 redraws/s at most)
+LOG_MAX_LINES = 5000   # oldest lines are dropped beyond this
+
+
+def _load_json(path):
+    """Parses a JSON file from its raw bytes (orjson when installed)"""
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(obj, path):
+    """Writes obj as 2-space indented UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    Path(path).write_bytes(data)
+
 
 def resource_path(relative_path):
     """Returns resource path from PyInstaller bundle or external"""
@@ -43,6 +82,16 @@ def resource_path(relative_path):
     return str(base_path / relative_path)
 
 
+def _file_digest(path):
+    """BLAKE2b digest of a file's contents, hashed straight from a read-only mapping"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:   # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    return h.digest()
+
+
 class FontPipelineManager:
     def __init__(self, root):
         self.root = root
@@ -51,9 +100,7 @@ class FontPipelineManager:
         if getattr(sys, 'frozen', False):
             self.work_dir = Path(sys.executable).parent
         else:
-            self.work_dir = Path(__file__).parent
-
-        os.chdir(self.work_dir)
+            self.work_dir = Path(__file__).resolve().parent
 
         try:
             if getattr(sys, 'frozen', False):
@@ -70,6 +117,21 @@ class FontPipelineManager:
 
         self.input_dir  = self.work_dir / 'witchs_pot'
         self.output_dir = self.work_dir / 'witchs_gift'
+        self.input_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Bundled tools never move during a session
+        self._msdf_exe    = resource_path('msdf-atlas-gen.exe')
+        self._texconv_exe = resource_path('texconv.exe')
+
+        # Hidden-console launch options shared by every tool invocation (Windows only)
+        self._startupinfo = None
+        self._creationflags = 0
+        if sys.platform == 'win32':
+            self._startupinfo = subprocess.STARTUPINFO()
+            self._startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            self._startupinfo.wShowWindow = subprocess.SW_HIDE
+            self._creationflags = subprocess.CREATE_NO_WINDOW
 
         self.config = {
             'font_file': '',
@@ -84,21 +146,49 @@ class FontPipelineManager:
             'spacing_ratio': '1.0',
             'spacing_symmetric': False,
             'uv_inset': '0.0',
+            'dds_format': 'R8G8B8A8_UNORM',
         }
 
         self.is_running = False
 
+        # The pipeline runs as a coroutine on this loop (own daemon thread), so
+        # external tools are awaited instead of blocking a worker thread each
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        self._pipeline_future = None
+
+        # (mtime_ns, font / charset / target combobox values) of the last input_dir scan
+        self._input_scan_cache = None
+
+        # (mtime_ns, parsed tree) of the step 3 order template
+        self._template_cache = None
+
+        # Local modules, imported on first use by the _get_* helpers
+        self._xml_generator = None
+        self._merge_module = None
+        self._comparator_module = None
+
+        # log_message only enqueues; _drain_log writes batches on the main thread
+        self._log_queue = queue.Queue()
+        # "%H:%M:%S" is re-formatted only when the second changes
+        self._log_ts_sec = None
+        self._log_ts_str = ""
+        # update_progress keeps only the latest value; _flush_progress draws it
+        self._pending_progress = None
+        self._progress_scheduled = False
+
         self.setup_ui()
         self.load_config()
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
 
     # ── UI setup ────────────────────────────────────────────────────
 
     def setup_ui(self):
         main_frame = ctk.CTkFrame(self.root, fg_color="transparent")
         main_frame.pack(fill='both', expand=True, padx=12, pady=12)
-        # grid 내부 반응형: 가로 weight=1, Log 행(5)만 세로 weight=1
+        # grid 내부 반응형: 가로 weight=1, Log 행(6)만 세로 weight=1
         main_frame.columnconfigure(0, weight=1)
-        main_frame.rowconfigure(5, weight=1)
+        main_frame.rowconfigure(6, weight=1)
         self.setup_main_tab(main_frame)
 
     def setup_main_tab(self, parent):
@@ -261,7 +351,17 @@ class FontPipelineManager:
         ctk.CTkCheckBox(r, text="Symmetric — trim both sides equally",
                         variable=self.spacing_symmetric_var).pack(side='left', pady=(2, 4))
 
-        # ══ 4. Buttons ═══════════════════════════════════════════════
+        # ══ 4. DDS Conversion (Step 4) ═════════════════════════════
+        f4 = section("DDS Conversion  (Step 4)")
+
+        r = make_row(f4)
+        lbl(r, "DDS Format:")
+        self.dds_format_var = tk.StringVar(value=self.config['dds_format'])
+        ctk.CTkComboBox(r, variable=self.dds_format_var, width=180, state='readonly',
+                        values=list(DDS_FORMATS)).pack(side='left')
+        hint(r, "BC7 = EXPERIMENTAL (sRGB + mipmaps can distort glyph edges, unverified in game)")
+
+        # ══ 5. Buttons ═══════════════════════════════════════════════
         _row_counter[0] += 1
         bf = ctk.CTkFrame(parent, fg_color="transparent")
         bf.grid(row=_row_counter[0], column=0, pady=8)
@@ -288,7 +388,7 @@ class FontPipelineManager:
                       command=self.open_output_folder
                       ).grid(row=1, column=1, padx=5, pady=3)
 
-        # ══ 5. Progress ══════════════════════════════════════════════
+        # ══ 6. Progress ══════════════════════════════════════════════
         _row_counter[0] += 1
         pf = ctk.CTkFrame(parent, fg_color="transparent")
         pf.grid(row=_row_counter[0], column=0, sticky='ew', pady=(6, 2))
@@ -301,9 +401,9 @@ class FontPipelineManager:
         self.progress_bar.set(0)
         self.progress_bar.pack(fill='x', padx=4, pady=(4, 6))
 
-        # ══ 6. Log (row=5, weight=1 → 남은 세로 공간 모두 흡수) ══════
+        # ══ 7. Log (row=6, weight=1 → 남은 세로 공간 모두 흡수) ══════
         lf = ctk.CTkFrame(parent, corner_radius=8)
-        lf.grid(row=5, column=0, sticky='nsew', pady=(2, 6))
+        lf.grid(row=6, column=0, sticky='nsew', pady=(2, 6))
         lf.columnconfigure(0, weight=1)
         lf.rowconfigure(0, weight=1)
 
@@ -311,9 +411,9 @@ class FontPipelineManager:
             lf, font=ctk.CTkFont(family="Consolas", size=11))
         self.log_text.grid(row=0, column=0, sticky='nsew', padx=8, pady=8)
 
-        # ══ 7. Font Viewer ════════════════════════════════════════════
+        # ══ 8. Font Viewer ════════════════════════════════════════════
         vf = ctk.CTkFrame(parent, fg_color="transparent")
-        vf.grid(row=6, column=0, pady=(0, 6))
+        vf.grid(row=7, column=0, pady=(0, 6))
         ctk.CTkButton(vf, text="Launch Font Viewer", width=160,
                       command=self.launch_coordinate_comparator).pack()
 
@@ -323,14 +423,7 @@ class FontPipelineManager:
 
     def refresh_font_list(self):
         try:
-            if not self.input_dir.exists():
-                self.input_dir.mkdir(parents=True)
-                self.log_message(f"Input folder created: {self.input_dir}")
-
-            font_files = []
-            for ext in ['*.ttf', '*.otf']:
-                font_files.extend(self.input_dir.glob(ext))
-            font_names = [f.name for f in font_files]
+            font_names, charset_names, _ = self._scan_input_dir()
 
             self.font_combo.configure(values=font_names)
             if font_names:
@@ -338,8 +431,6 @@ class FontPipelineManager:
             else:
                 self.log_message("[Warning] No font files found")
 
-            charset_files = list(self.input_dir.glob('*.txt'))
-            charset_names = ['basic'] + [f.name for f in charset_files]
             self.charset_combo.configure(values=charset_names)
             if 'charset.txt' in charset_names:
                 self.charset_combo.set('charset.txt')
@@ -351,10 +442,35 @@ class FontPipelineManager:
         except Exception as e:
             self.log_message(f"[Error] Failed to refresh file list: {e}")
 
+    def _scan_input_dir(self):
+        """Returns the (font, charset, target) combobox value tuples from one scandir pass;
+        reused as-is while the folder mtime is unchanged"""
+        mtime = self.input_dir.stat().st_mtime_ns
+        if self._input_scan_cache is not None and self._input_scan_cache[0] == mtime:
+            return self._input_scan_cache[1:]
+
+        ttf_names, otf_names, txt_names = [], [], []
+        with os.scandir(self.input_dir) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name.endswith('.ttf'):
+                    ttf_names.append(entry.name)
+                elif name.endswith('.otf'):
+                    otf_names.append(entry.name)
+                elif name.endswith('.txt'):
+                    txt_names.append(entry.name)
+
+        self._input_scan_cache = (
+            mtime,
+            tuple(ttf_names + otf_names),
+            ('basic', *txt_names),
+            ('none', *txt_names),
+        )
+        return self._input_scan_cache[1:]
+
     def refresh_txt_combos(self, silent=False):
         try:
-            txt_files = list(self.input_dir.glob('*.txt')) if self.input_dir.exists() else []
-            names = ['none'] + [f.name for f in txt_files]
+            names = self._scan_input_dir()[2]
 
             self.h_scale_chars_combo.configure(values=names)
             if self.h_scale_chars_var.get() not in names:
@@ -411,14 +527,11 @@ class FontPipelineManager:
             content = f.read()
         return {ord(ch) for ch in content if ch not in ('\n', '\r')}
 
+    # input_dir / output_dir are created once in __init__
     def open_input_folder(self):
-        if not self.input_dir.exists():
-            self.input_dir.mkdir(parents=True)
         os.startfile(str(self.input_dir))
 
     def open_output_folder(self):
-        if not self.output_dir.exists():
-            self.output_dir.mkdir(parents=True)
         os.startfile(str(self.output_dir))
 
     # ── Save / Load settings ─────────────────────────────────────────
@@ -437,11 +550,11 @@ class FontPipelineManager:
             'spacing_chars_file': self.spacing_chars_var.get(),
             'spacing_ratio':      self.spacing_ratio_var.get(),
             'spacing_symmetric':  self.spacing_symmetric_var.get(),
+            'dds_format':         self.dds_format_var.get(),
         }
         filename = self.work_dir / "user_config.json"
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            _dump_json(config, filename)
             self.log_message("Settings saved")
         except Exception as e:
             self.log_message(f"[Error] Failed to save settings")
@@ -451,8 +564,7 @@ class FontPipelineManager:
         if not filename.exists():
             return
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = _load_json(filename)
             self.font_file_var.set(config.get('font_file', ''))
             self.charset_var.set(config.get('charset_file', ''))
             self.font_size_var.set(config.get('font_size', '74'))
@@ -465,23 +577,95 @@ class FontPipelineManager:
             self.spacing_chars_var.set(config.get('spacing_chars_file', 'none'))
             self.spacing_ratio_var.set(config.get('spacing_ratio', '1.0'))
             self.spacing_symmetric_var.set(config.get('spacing_symmetric', False))
+            if config.get('dds_format') in DDS_FORMATS:
+                self.dds_format_var.set(config['dds_format'])
         except Exception:
             pass
 
     # ── Log / Progress ───────────────────────────────────────────────
 
+    def _call_in_main(self, func, *args):
+        """Runs func on the Tk main thread (worker threads must not touch widgets)"""
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+        else:
+            self.root.after(0, func, *args)
+
     def log_message(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_line = f"[{timestamp}] {message}\n"
-        self.log_text.insert(ctk.END, log_line)
-        self.log_text.see(ctk.END)
-        self.root.update_idletasks()
+        """Thread-safe: queues the line, _drain_log inserts it"""
+        now = int(time.time())
+        if now != self._log_ts_sec:
+            self._log_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_ts_sec = now
+        self._log_queue.put_nowait(f"[{self._log_ts_str}] {message}\n")
+
+    def _drain_log(self):
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.log_text.insert(ctk.END, ''.join(lines))
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > LOG_MAX_LINES:
+                self.log_text.delete('1.0', f'{line_count - LOG_MAX_LINES + 1}.0')
+            self.log_text.see(ctk.END)
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
 
     def update_progress(self, step, total, message):
-        pct = step / total
-        self.progress_bar.set(pct)
-        self.progress_var.set(f"{message} ({step}/{total})")
-        self.root.update_idletasks()
+        self._queue_progress(step / total, f"{message} ({step}/{total})")
+
+    def _queue_progress(self, pct, text):
+        """Thread-safe: keeps only the latest value, one redraw per idle cycle"""
+        self._pending_progress = (pct, text)
+        if not self._progress_scheduled:
+            self._progress_scheduled = True
+            self.root.after_idle(self._flush_progress)
+
+    def _flush_progress(self):
+        self._progress_scheduled = False
+        pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            pct, text = pending
+            self.progress_bar.set(pct)
+            self.progress_var.set(text)
+
+    # ── Local modules (imported lazily) ──────────────────────────────
+
+    def _get_xml_generator(self):
+        """json_to_xml.XMLGenerator, or None if the module cannot be imported"""
+        if self._xml_generator is None:
+            try:
+                from json_to_xml import XMLGenerator
+            except ImportError as e:
+                print(f"Module import failed: {e}")
+                return None
+            self._xml_generator = XMLGenerator
+        return self._xml_generator
+
+    def _get_merge(self):
+        """l_merge_libraries module, or None if it cannot be imported"""
+        if self._merge_module is None:
+            try:
+                import l_merge_libraries
+            except ImportError as e:
+                print(f"Module import failed: {e}")
+                return None
+            self._merge_module = l_merge_libraries
+        return self._merge_module
+
+    def _get_comparator(self):
+        """coordinate_comparator module, or None if it cannot be imported"""
+        if self._comparator_module is None:
+            try:
+                import coordinate_comparator
+            except ImportError as e:
+                print(f"Module import failed: {e}")
+                return None
+            self._comparator_module = coordinate_comparator
+        return self._comparator_module
 
     # ── Pipeline ─────────────────────────────────────────────────────
 
@@ -497,18 +681,18 @@ class FontPipelineManager:
             self.log_message(f"[Error] Font file does not exist: {font_path}")
             return
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        thread = threading.Thread(target=self._run_pipeline_thread, daemon=True)
-        thread.start()
+        self.is_running = True
+        self._pipeline_future = asyncio.run_coroutine_threadsafe(
+            self._run_pipeline_async(), self._loop)
 
-    def _run_pipeline_thread(self):
+    async def _run_pipeline_async(self):
         try:
-            self.is_running = True
-            self.run_button.configure(state='disabled')
+            self._call_in_main(self._set_run_button_state, 'disabled')
             self.log_message("Pipeline started...")
             total_steps = 4
 
             self.update_progress(1, total_steps, "Generating MTSDF atlas...")
-            if not self.step1_generate_mtsdf():
+            if not await self.step1_generate_mtsdf():
                 self.log_message("[Error] Pipeline aborted: MTSDF generation failed")
                 return
 
@@ -517,68 +701,139 @@ class FontPipelineManager:
                 self.log_message("[Error] Pipeline aborted: JSON conversion failed")
                 return
 
-            self.update_progress(3, total_steps, "Merging XML libraries...")
-            if not self.step3_merge_libraries():
-                self.log_message("[Error] Pipeline aborted: XML merge failed")
-                return
+            # Step 3 (XML merge) and step 4 (texconv) only depend on step 1/2 outputs,
+            # so texconv runs while the merge is in progress
+            self.update_progress(3, total_steps, "Merging XML libraries / converting texture to DDS...")
+            merge_ok, dds_ok = await asyncio.gather(
+                self._loop.run_in_executor(None, self.step3_merge_libraries),
+                self.step4_convert_to_dds(),
+            )
 
-            self.update_progress(4, total_steps, "Converting texture to DDS...")
-            if not self.step4_convert_to_dds():
+            if not dds_ok:
                 self.log_message("[Warning] DDS conversion failed (continuing)")
+            if not merge_ok:
+                self.log_message("[Error] Pipeline aborted: XML merge failed")
+                return
 
-            self.progress_bar.set(1.0)
-            self.progress_var.set("Complete!")
+            self._queue_progress(1.0, "Complete!")
             self.log_message("All tasks completed!")
 
         except Exception as e:
             self.log_message(f"[Error] Exception occurred: {e}")
         finally:
             self.is_running = False
-            self.run_button.configure(state='normal')
+            self._call_in_main(self._set_run_button_state, 'normal')
+
+    def _set_run_button_state(self, state):
+        self.run_button.configure(state=state)
+
+    def _staging_dir(self):
+        """Steps write here first so a failed/aborted run never leaves torn outputs"""
+        staging = self.output_dir / STAGING_DIR
+        staging.mkdir(parents=True, exist_ok=True)
+        return staging
+
+    def _commit_staged(self, *names):
+        """Moves finished files from the staging folder over the real outputs (atomic rename)"""
+        for name in names:
+            os.replace(self.output_dir / STAGING_DIR / name, self.output_dir / name)
+
+    async def _run_and_stream(self, cmd, tag):
+        """Runs an external tool, logging its stdout/stderr line by line as it arrives"""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            startupinfo=self._startupinfo, creationflags=self._creationflags)
+        async for raw in proc.stdout:
+            line = raw.decode('utf-8', errors='ignore').rstrip()
+            if line:
+                self.log_message(f"[{tag}] {line}")
+        return await proc.wait()
+
+    def _atlas_fingerprint(self, font_path, charset_path):
+        """Cache key for step 1: font/charset contents + every setting that changes the atlas"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(_file_digest(font_path))
+        h.update(_file_digest(charset_path) if charset_path else b'basic')
+        h.update(f"{self.font_size_var.get()}|{self.pxrange_var.get()}|{self.padding_var.get()}".encode())
+        return h.hexdigest()
+
+    def _prune_atlas_cache(self, cache_root):
+        """Deletes all but the ATLAS_CACHE_MAX_ENTRIES most recently used atlas cache entries
+
+        Entries are ordered by directory mtime, which a cache hit refreshes.
+        """
+        try:
+            entries = [e for e in os.scandir(cache_root) if e.is_dir()]
+        except OSError:
+            return
+        if len(entries) <= ATLAS_CACHE_MAX_ENTRIES:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        for entry in entries[ATLAS_CACHE_MAX_ENTRIES:]:
+            shutil.rmtree(entry.path, ignore_errors=True)
 
-    def step1_generate_mtsdf(self):
+    async def step1_generate_mtsdf(self):
         self.log_message("[1/4] Generating MTSDF atlas...")
         try:
             font_path = self.input_dir / self.font_file_var.get()
-            msdf_exe = resource_path('msdf-atlas-gen.exe')
             cmd = [
-                msdf_exe,
+                self._msdf_exe,
                 '-font', str(font_path),
                 '-type', 'mtsdf',
                 '-size', self.font_size_var.get(),
                 '-pxrange', self.pxrange_var.get(),
                 '-yorigin', 'bottom',
+                '-threads', str(os.cpu_count() or 4),
             ]
             padding = self.padding_var.get()
             if padding and padding != '0':
                 cmd.extend(['-pxpadding', padding])
-            texture_name = self.font_name_var.get()
+            png_name  = f'{self.font_name_var.get()}.png'
+            json_name = 'font-atlas.json'
+            staging   = self._staging_dir()
             cmd.extend([
-                '-imageout', str(self.output_dir / f'{texture_name}.png'),
-                '-json',     str(self.output_dir / 'font-atlas.json'),
+                '-imageout', str(staging / png_name),
+                '-json',     str(staging / json_name),
             ])
+            charset_path = None
             charset_file = self.charset_var.get()
             if charset_file and charset_file != 'basic':
                 charset_path = self.input_dir / charset_file
                 if charset_path.exists():
                     cmd.extend(['-charset', str(charset_path)])
+                else:
+                    charset_path = None
+
+            # Same font/charset bytes and settings → reuse the previous atlas
+            cache_root = self.work_dir / ATLAS_CACHE_DIR
+            cache_dir = cache_root / self._atlas_fingerprint(font_path, charset_path)
+            cached_png  = cache_dir / 'atlas.png'
+            cached_json = cache_dir / 'font-atlas.json'
+            if cached_png.exists() and cached_json.exists():
+                shutil.copyfile(cached_png, staging / png_name)
+                shutil.copyfile(cached_json, staging / json_name)
+                self._commit_staged(png_name, json_name)
+                try:
+                    os.utime(cache_dir)   # mark as recently used for _prune_atlas_cache
+                except OSError:
+                    pass
+                self.log_message("MTSDF atlas unchanged, reused cached atlas")
+                return True
 
-            startupinfo = None
-            if sys.platform == 'win32':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-
-            result = subprocess.run(cmd, capture_output=True, text=True,
-                                    encoding='utf-8', errors='ignore',
-                                    startupinfo=startupinfo)
-            if result.returncode == 0:
+            returncode = await self._run_and_stream(cmd, 'msdf-atlas-gen')
+            if returncode == 0:
+                self._commit_staged(png_name, json_name)
                 self.log_message("MTSDF atlas generation complete")
+                try:
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(self.output_dir / png_name, cached_png)
+                    shutil.copyfile(self.output_dir / json_name, cached_json)
+                except OSError as e:
+                    self.log_message(f"[Warning] Failed to cache MTSDF atlas: {e}")
+                self._prune_atlas_cache(cache_root)
                 return True
             else:
-                self.log_message(f"[Error] msdf-atlas-gen failed (code: {result.returncode})")
-                if result.stderr:
-                    self.log_message(f"Error: {result.stderr}")
+                self.log_message(f"[Error] msdf-atlas-gen failed (code: {returncode})")
                 return False
         except Exception as e:
             self.log_message(f"[Error] MTSDF generation error: {e}")
@@ -596,6 +851,7 @@ class FontPipelineManager:
             if not json_path.exists():
                 self.log_message(f"[Error] JSON file not found: {json_path}")
                 return False
+            XMLGenerator = self._get_xml_generator()
             if XMLGenerator is None:
                 self.log_message("[Error] Cannot load json_to_xml module")
                 return False
@@ -646,9 +902,22 @@ class FontPipelineManager:
                 self.log_message("[Warning] Invalid UV Inset value, using 0.0")
                 uv_inset = 0.0
 
+            stamp_path = generated_library_dir / LIBRARY_STAMP
+            stamp = self._library_fingerprint(json_path, (
+                texture_name, font_name, h_scale,
+                None if h_scale_chars is None else sorted(h_scale_chars),
+                None if spacing_chars is None else sorted(spacing_chars),
+                spacing_ratio, spacing_symmetric, uv_inset))
+            outputs = [generated_library_dir / name for name in GENERATED_LIBRARIES]
+            if self._stamp_matches(stamp_path, stamp, outputs):
+                self.log_message("Atlas JSON and settings unchanged, reused generated libraries")
+                return True
+            stamp_path.unlink(missing_ok=True)
+
             try:
                 generator = XMLGenerator(
                     str(json_path), texture_name, font_name,
+                    data=_load_json(json_path),
                     h_scale=h_scale,
                     h_scale_chars=h_scale_chars,
                     spacing_chars=spacing_chars,
@@ -657,6 +926,7 @@ class FontPipelineManager:
                     uv_inset=uv_inset,
                 )
                 generator.generate_libraries(str(generated_library_dir))
+                stamp_path.write_text(stamp, encoding='ascii')
                 sym_label = " symmetric" if spacing_symmetric else ""
                 uv_label  = f", uv_inset={uv_inset}" if uv_inset > 0 else ""
                 self.log_message(
@@ -673,23 +943,71 @@ class FontPipelineManager:
             self.log_message(f"[Error] JSON conversion error: {e}")
             return False
 
+    def _library_fingerprint(self, json_path, settings):
+        """Skip key for step 2: font-atlas.json contents + every setting passed to XMLGenerator"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(_file_digest(json_path))
+        h.update(repr(settings).encode())
+        return h.hexdigest()
+
+    def _merge_fingerprint(self, input_dir, template_path):
+        """Skip key for step 3: size/mtime of each generated library + the template's contents"""
+        h = hashlib.blake2b(digest_size=16)
+        for name in GENERATED_LIBRARIES:
+            try:
+                st = (input_dir / name).stat()
+                h.update(f"{name}|{st.st_size}|{st.st_mtime_ns}\n".encode())
+            except FileNotFoundError:
+                h.update(f"{name}|-\n".encode())
+        h.update(_file_digest(template_path))
+        return h.hexdigest()
+
+    def _stamp_matches(self, stamp_path, stamp, outputs):
+        """True when the stored skip key equals stamp and every output still exists"""
+        try:
+            if stamp_path.read_text(encoding='ascii') != stamp:
+                return False
+        except OSError:
+            return False
+        return all(p.exists() for p in outputs)
+
+    def _order_template(self, merge, template_path):
+        """Root/PSSGDATABASE header of the LIBRARY_NODE.xml template, re-read only when the file changes"""
+        mtime = os.stat(template_path).st_mtime_ns
+        if self._template_cache is None or self._template_cache[0] != mtime:
+            self._template_cache = (mtime, merge.load_order_template(template_path))
+        return self._template_cache[1]
+
     def step3_merge_libraries(self):
         self.log_message("[3/4] Merging XML libraries...")
         try:
-            if merge_xml_libraries_ordered is None:
+            merge = self._get_merge()
+            if merge is None:
                 self.log_message("[Error] Cannot load l_merge_libraries module")
                 return False
             input_dir     = self.output_dir / 'generated_library'
             template_path = resource_path('separated_libraries_raw/LIBRARY_NODE.xml')
-            output_path   = self.output_dir / 'node.xml'
+            staged_path   = self._staging_dir() / 'node.xml'
             if not os.path.exists(template_path):
                 self.log_message(f"[Error] Template file not found: {template_path}")
                 return False
             if not input_dir.exists():
                 self.log_message(f"[Error] Generated library folder not found: {input_dir}")
                 return False
-            merge_xml_libraries_ordered(str(input_dir), str(template_path), str(output_path))
-            if output_path.exists():
+            stamp_path = self.output_dir / NODE_STAMP
+            stamp = self._merge_fingerprint(input_dir, template_path)
+            if self._stamp_matches(stamp_path, stamp, [self.output_dir / 'node.xml']):
+                self.log_message("Generated libraries unchanged, reused node.xml")
+                return True
+            stamp_path.unlink(missing_ok=True)
+            if staged_path.exists():
+                staged_path.unlink()
+            merge.merge_xml_libraries_ordered(input_dir, template_path, staged_path,
+                                              template_tree=self._order_template(merge, template_path),
+                                              verbose=False)
+            if staged_path.exists():
+                self._commit_staged('node.xml')
+                stamp_path.write_text(stamp, encoding='ascii')
                 self.log_message("XML library merge complete")
                 return True
             else:
@@ -701,41 +1019,41 @@ class FontPipelineManager:
             self.log_message(traceback.format_exc())
             return False
 
-    def step4_convert_to_dds(self):
+    def _texture_pngs(self):
+        """Atlas PNGs produced by this run (texconv converts them all in one call)"""
+        return [self.output_dir / f"{self.font_name_var.get()}.png"]
+
+    async def step4_convert_to_dds(self):
         self.log_message("[4/4] Converting PNG to DDS...")
         try:
-            texture_name = self.font_name_var.get()
-            input_png    = self.output_dir / f"{texture_name}.png"
-            if not input_png.exists():
-                self.log_message(f"[Error] PNG file not found: {input_png}")
+            input_pngs = self._texture_pngs()
+            missing = [p for p in input_pngs if not p.exists()]
+            if missing:
+                for png in missing:
+                    self.log_message(f"[Error] PNG file not found: {png}")
                 return False
-            texconv_exe = resource_path('texconv.exe')
-            if not os.path.exists(texconv_exe):
-                self.log_message(f"[Error] texconv.exe not found: {texconv_exe}")
+            if not os.path.exists(self._texconv_exe):
+                self.log_message(f"[Error] texconv.exe not found: {self._texconv_exe}")
                 return False
+            dds_format = self.dds_format_var.get()
+            if dds_format in EXPERIMENTAL_DDS_FORMATS:
+                self.log_message(f"[Warning] {dds_format} is experimental and unverified in game "
+                                 "(sRGB decode and mipmaps can distort the MTSDF); use R8G8B8A8_UNORM if text looks wrong")
             cmd = [
-                texconv_exe,
-                '-f', 'R8G8B8A8_UNORM',
-                '-w', '0', '-h', '0', '-m', '1',
+                self._texconv_exe,
+                *DDS_FORMATS[dds_format],
+                '-w', '0', '-h', '0',
                 '-srgb', '-y',
-                '-o', str(self.output_dir),
-                str(input_png)
+                '-o', str(self._staging_dir()),
+                *map(str, input_pngs)
             ]
-            startupinfo = None
-            if sys.platform == 'win32':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-            result = subprocess.run(cmd, capture_output=True, text=True,
-                                    encoding='utf-8', errors='ignore',
-                                    startupinfo=startupinfo)
-            if result.returncode == 0:
-                self.log_message("DDS conversion complete")
+            returncode = await self._run_and_stream(cmd, 'texconv')
+            if returncode == 0:
+                self._commit_staged(*(f"{png.stem}.dds" for png in input_pngs))
+                self.log_message(f"DDS conversion complete ({len(input_pngs)} texture(s))")
                 return True
             else:
-                self.log_message(f"[Error] texconv failed (code: {result.returncode})")
-                if result.stderr:
-                    self.log_message(f"Error: {result.stderr}")
+                self.log_message(f"[Error] texconv failed (code: {returncode})")
                 return False
         except Exception as e:
             self.log_message(f"[Error] DDS conversion error: {e}")
@@ -743,6 +1061,7 @@ class FontPipelineManager:
 
     def launch_coordinate_comparator(self):
         try:
+            coordinate_comparator = self._get_comparator()
             if coordinate_comparator is None:
                 self.log_message("[Error] Cannot load coordinate_comparator module.")
                 return
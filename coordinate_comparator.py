@@ -2,27 +2,273 @@
 Font Coordinate Viewer - Original vs New File Visualization Tool
 """
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 import customtkinter as ctk
 import json
-import xml.etree.ElementTree as ET
+try:
+    # lxml(libxml2)이 있으면 파싱에 사용, 없으면 표준 라이브러리
+    from lxml import etree as ET
+    _ITERPARSE_OPTIONS = {'huge_tree': True}
+
+    def _xml_parser():
+        """New parser for each parse: one shared lxml parser serializes threads on its lock"""
+        return ET.XMLParser(huge_tree=True, remove_blank_text=True)
+
+    def _iter_datablocks(path):
+        """Streams path's DATABLOCK elements; each one is cleared and detached after use"""
+        for _, elem in ET.iterparse(path, events=('end',), tag='DATABLOCK', **_ITERPARSE_OPTIONS):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS = {}
+
+    def _xml_parser():
+        return None
+
+    def _iter_datablocks(path):
+        """Streams path's DATABLOCK elements; each one is cleared and detached after use"""
+        parents = []   # ElementTree에는 getparent()가 없으므로 start 이벤트로 부모를 추적
+        for event, elem in ET.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                continue
+            parents.pop()
+            if elem.tag == 'DATABLOCK':
+                yield elem
+                elem.clear()
+                if parents:
+                    del parents[-1][:-1]   # 이미 처리한 앞 형제들을 떼어냄
 import struct
+import array
+import binascii
+import functools
+import heapq
+import operator
+import mmap
+import concurrent.futures
+import threading
 import os
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from PIL import Image, ImageTk
+try:
+    import orjson   # optional, faster font-atlas.json parsing
+except ImportError:
+    orjson = None
+
+PHOTO_CACHE_SIZE = 256   # rendered glyph PhotoImages kept for redraws
+ATLAS_CACHE_SIZE = 4     # decoded atlas images kept (each is a full texture in memory)
+XML_CACHE_SIZE = 32      # parsed XML trees kept across viewer windows
+DATABLOCK_CACHE_SIZE = 8  # decoded RENDERINTERFACEBOUND tables kept across viewer windows
+RESIZE_DEBOUNCE_MS = 120  # redraw only after <Configure> events pause this long
+LOG_MAX_LINES = 5000     # older log lines are dropped so inserts stay cheap in long sessions
+LOG_MAX_DIFF_VERTICES = 50  # differing vertices listed per glyph (largest differences first)
+
+# Parsed XML cache shared by every viewer window in this process:
+# path -> (mtime_ns, root, {(tag, attr): {value: element}, derived tables...}), LRU
+# Reopening the viewer from the pipeline GUI reuses the bundled libraries' trees.
+_XML_CACHE = OrderedDict()
+
+# RENDERINTERFACEBOUND libraries are streamed instead of kept as trees:
+# path -> (mtime_ns, {DATABLOCK id: datablock_record(...)}), LRU
+_DATABLOCK_CACHE = OrderedDict()
+
+# Guards lookups/inserts of the two caches above (the indexing worker fills them while the
+# Tk thread reads them); files are parsed outside the lock so the Tk thread never waits on a parse
+_CACHE_LOCK = threading.Lock()
+
+# Background indexing shared by viewer windows: a viewer reopened while the previous window's
+# indexing is still running waits on that future instead of parsing the same libraries again
+_INDEX_EXECUTOR = None
+_INDEX_FUTURE = None
+
+INDEX_POLL_MS = 50   # how often actions deferred until the indexing finishes check the future
+
+MMAP_READ_THRESHOLD = 4 * 1024 * 1024   # files larger than this are read through mmap
+
+# DATABLOCKDATA hex 텍스트에서 공백 문자를 한 번에 제거하는 변환표
+_WS_TABLE = str.maketrans('', '', ' \n\r\t\x0b\x0c')
+
+def _read_bytes(path):
+    """파일 전체를 한 번에 바이트로 읽습니다 (큰 파일은 읽기 전용 mmap에서 복사)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_READ_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+        return f.read()
+
+def _load_json(path):
+    """JSON 파일을 바이트로 읽어 파싱합니다 (orjson이 있으면 사용)."""
+    data = _read_bytes(path)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+@functools.lru_cache(maxsize=4)
+def _load_json_cached(path, mtime_ns):
+    """_load_json 결과를 (경로, mtime)별로 보관합니다. 반환값은 공유되므로 수정하지 마세요."""
+    return _load_json(path)
+
+@functools.lru_cache(maxsize=4)
+def _json_glyph_index(path, mtime_ns):
+    """font-atlas.json의 {unicode: 첫 번째 glyph} 색인 (파일당 한 번 생성)"""
+    index = {}
+    for glyph in _load_json_cached(path, mtime_ns).get('glyphs', ()):
+        index.setdefault(glyph.get('unicode'), glyph)
+    return index
+
+
+# Bundled resource root: temporary folder created by PyInstaller,
+# or this file's folder when running as a regular Python script
+_RESOURCE_BASE = Path(getattr(sys, '_MEIPASS', Path(__file__).parent))
+
 
 # Helper function to find PyInstaller bundled resource paths
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
     """Returns resource path from inside or outside PyInstaller bundle"""
-    try:
-        # Temporary folder created by PyInstaller
-        base_path = Path(sys._MEIPASS)
-    except AttributeError:
-        # Running as regular Python script
-        base_path = Path(__file__).parent
-    
-    return base_path / relative_path
+    return _RESOURCE_BASE / relative_path
+
+
+def vertex_differences(original_positions, new_positions, original_uvs, new_uvs, tolerance=0.0001):
+    """정점별 Position/UV 절대 차이 합을 계산합니다.
+
+    tolerance를 넘는 정점만 (index, pos_diff_sum, uv_diff_sum) 리스트로 반환합니다.
+    """
+    differences = []
+    vertices = zip(original_positions, new_positions, original_uvs, new_uvs)
+    for i, (original_pos, new_pos, original_uv, new_uv) in enumerate(vertices):
+        if original_pos == new_pos and original_uv == new_uv:
+            continue  # 완전히 같은 정점은 차이 계산 생략
+        # 성분별 |a - b| 합 (map으로 C 수준에서 계산)
+        pos_diff_sum = sum(map(abs, map(operator.sub, original_pos, new_pos)))
+        uv_diff_sum = sum(map(abs, map(operator.sub, original_uv, new_uv)))
+        if pos_diff_sum > tolerance or uv_diff_sum > tolerance:  # 작은 차이는 무시
+            differences.append((i, pos_diff_sum, uv_diff_sum))
+    return differences
+
+
+def codepoint_char(codepoint):
+    """로그/라벨에 쓸 코드포인트의 문자 (유니코드 범위 밖이면 '?')"""
+    return chr(codepoint) if 0 <= codepoint < 0x110000 else '?'
+
+
+def parse_codepoints(char_input):
+    """입력 문자열을 코드포인트 리스트로 변환합니다.
+
+    쉼표가 있으면 각 항목을 단일 문자(숫자 제외)는 ord, 그 외는 정수 ID로 읽고(빈 항목 무시),
+    없으면 문자열의 각 문자를 ord로 변환합니다. 잘못된 ID는 ValueError를 냅니다.
+    """
+    if ',' not in char_input:
+        return list(map(ord, char_input))
+    return [ord(part) if len(part) == 1 and not part.isdigit() else int(part)
+            for part in map(str.strip, char_input.split(',')) if part]
+
+
+# big-endian Position(xyz) / UV(uv) 단일 정점 언팩 (포맷은 모듈 로드 시 한 번만 컴파일)
+_POS_UNPACK = struct.Struct('>fff').unpack_from
+_UV_UNPACK = struct.Struct('>ff').unpack_from
+
+
+def unpack_vertices(byte_data, element_count, stride, pos_offset, uv_offset):
+    """DATABLOCKDATA 바이트에서 big-endian Position(xyz)/UV(uv) 정점을 한 번에 풀어냅니다.
+
+    버퍼에 두 필드가 모두 들어 있는 정점까지만 (positions, uvs)로 반환합니다. 둘 다 정점 튜플의
+    튜플이라 로드 결과를 캐시해 여러 비교에서 공유해도 안전합니다.
+    """
+    end = max(pos_offset + 12, uv_offset + 8)   # 3 * 4 bytes, 2 * 4 bytes
+    count = max(0, min(element_count, (len(byte_data) - end) // stride + 1))
+    if end > stride:
+        # 필드가 레코드 경계를 넘는 비정상 레이아웃: 정점별로 읽기
+        positions = tuple(_POS_UNPACK(byte_data, i * stride + pos_offset) for i in range(count))
+        uvs = tuple(_UV_UNPACK(byte_data, i * stride + uv_offset) for i in range(count))
+        return positions, uvs
+    # 복사 없이 memoryview로 잘라 쓰고, 마지막 정점의 뒤쪽 패딩이 잘려 있을 때만 stride 배수로 채움
+    size = count * stride
+    records = memoryview(byte_data)[:size]
+    if len(records) < size:
+        records = records.tobytes().ljust(size, b'\0')
+    if stride % 4 == 0 and pos_offset % 4 == 0 and uv_offset % 4 == 0:
+        # float 정렬 레이아웃: 전체를 float32 배열로 한 번에 변환 후 성분별 strided slice
+        floats = array.array('f')
+        floats.frombytes(records)
+        if sys.byteorder == 'little':
+            floats.byteswap()
+        w, p, u = stride // 4, pos_offset // 4, uv_offset // 4
+        positions = tuple(zip(floats[p::w], floats[p + 1::w], floats[p + 2::w]))
+        uvs = tuple(zip(floats[u::w], floats[u + 1::w]))
+        return positions, uvs
+    pos_record = struct.Struct(f'>{pos_offset}x3f{stride - pos_offset - 12}x')
+    uv_record = struct.Struct(f'>{uv_offset}x2f{stride - uv_offset - 8}x')
+    return tuple(pos_record.iter_unpack(records)), tuple(uv_record.iter_unpack(records))
+
+
+def coord_bounds(coords):
+    """[(x, y, ...), ...] 좌표의 (x_min, y_min, x_max, y_max)를 계산합니다 (zip으로 한 번에 전치)."""
+    xs, ys = tuple(zip(*coords))[:2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def datablock_streams(datablock):
+    """DATABLOCK의 직계 DATABLOCKSTREAM을 한 번 훑어 (Position, UV) 스트림을 찾습니다.
+
+    renderType이 'Vertex'/'ST'인 첫 번째 스트림을 반환하며, 없으면 None입니다.
+    """
+    pos_stream = uv_stream = None
+    for stream in datablock.iterfind('DATABLOCKSTREAM'):
+        render_type = stream.get('renderType')
+        if render_type == 'Vertex':
+            if pos_stream is None:
+                pos_stream = stream
+        elif render_type == 'ST':
+            if uv_stream is None:
+                uv_stream = stream
+    return pos_stream, uv_stream
+
+
+def datablock_record(datablock):
+    """DATABLOCK 요소에서 정점 디코딩에 필요한 값만 뽑아 dict로 반환합니다.
+
+    stride는 DATABLOCK의 stride 속성, 없으면 첫 DATABLOCKSTREAM의 stride입니다.
+    Vertex/ST 스트림이 없으면 해당 offset은 None, DATABLOCKDATA가 없으면 data는 None입니다.
+    """
+    stride_attr = datablock.get('stride')
+    if stride_attr:
+        stride = int(stride_attr)
+    else:
+        stream = datablock.find('DATABLOCKSTREAM')
+        stride = int(stream.get('stride', 0)) if stream is not None else 0
+    pos_stream, uv_stream = datablock_streams(datablock)
+    data_elem = datablock.find('DATABLOCKDATA')
+    if data_elem is None:
+        data = None
+    else:
+        try:
+            data = binascii.a2b_hex((data_elem.text or '').translate(_WS_TABLE))
+        except binascii.Error:
+            data = b''   # 잘못된 hex는 빈 데이터로 취급
+    return {
+        'element_count': int(datablock.get('elementCount', 0)),
+        'stride': stride,
+        'pos_offset': int(pos_stream.get('offset', 0)) if pos_stream is not None else None,
+        'uv_offset': int(uv_stream.get('offset', 0)) if uv_stream is not None else None,
+        'data': data
+    }
+
+
+def _start_indexing(build):
+    """Future of the running background indexing, or of build() submitted to the shared worker"""
+    global _INDEX_EXECUTOR, _INDEX_FUTURE
+    with _CACHE_LOCK:
+        if _INDEX_FUTURE is None or _INDEX_FUTURE.done():
+            if _INDEX_EXECUTOR is None:
+                _INDEX_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            _INDEX_FUTURE = _INDEX_EXECUTOR.submit(build)
+        return _INDEX_FUTURE
+
 
 class CoordinateComparator:
     def __init__(self, root):
@@ -36,8 +282,7 @@ class CoordinateComparator:
             self.work_dir = Path(sys.executable).parent
         else:
             # Running as regular Python script
-            self.work_dir = Path(__file__).parent
-        os.chdir(self.work_dir)
+            self.work_dir = Path(__file__).resolve().parent
         
         # Load Atlas image size
         self.atlas_width, self.atlas_height = self.load_atlas_size()
@@ -66,19 +311,57 @@ class CoordinateComparator:
         
         # Image cache (PhotoImage must maintain references)
         self.tk_images = []
+        # (texture, mtime, UV box, size) -> PhotoImage, kept across redraws (LRU)
+        self._photo_cache = OrderedDict()
+        # texture path -> (mtime_ns, decoded PIL atlas image), LRU
+        self._atlas_cache = OrderedDict()
+        # Canvas text fonts, created once (a font tuple is resolved again for every item)
+        self._grid_font = tkfont.Font(root=self.root, family='Arial', size=8)
+        self._axis_font = tkfont.Font(root=self.root, family='Arial', size=10, weight='bold')
+        self._uv_label_font = tkfont.Font(root=self.root, family='Arial', size=9, weight='bold')
+        self._pos_label_font = tkfont.Font(root=self.root, family='Arial', size=12, weight='bold')
+
+        # (canvas_width, canvas_height, baseline transform) of the items on canvas;
+        # other checkboxes only toggle item visibility by tag
+        self._drawn_state = None
+        # (canvas_width, canvas_height) of the 'layout' items (title, UV box, grid, crosshair)
+        self._layout_size = None
+        # Pending after() id of the debounced canvas resize
+        self._resize_after = None
+        # action -> pending after() id of a button action waiting for the background indexing
+        self._deferred = {}
         
         # metrics cache
         self.font_metrics = {}
-        self.glyph_metrics = {}
+
+        # Parsed XML cache (module-level, survives closing and reopening the viewer)
+        self._xml_cache = _XML_CACHE
+        # Decoded vertex tuples interned by value: DATABLOCKs with identical Position or UV data
+        # (reused glyph shapes, original vs. generated library) share one tuple object.
+        # Per viewer, cleared on close so tuples of replaced libraries are not kept alive
+        self._geom_intern = {}
         
         # Loaded data cache (stores both Original and transformed coordinates)
         self.loaded_data = {}
 
+        # log_message가 쌓아두고 _flush_log가 idle 시점에 한 번에 출력
+        self._log_buf = []
+        self._log_flush_pending = False
+        # True면 원본 좌표 로더의 단계별 디버그 로그(_debug_log)도 출력
+        self.verbose = False
+
         # Create UI elements
         self.setup_ui()
         
         # Check required file paths
         self.check_file_paths()
+
+        # 큰 라이브러리 XML 파싱/색인은 백그라운드 스레드에서 (mainloop가 막히지 않도록)
+        # 이전 창의 색인이 아직 진행 중이면 그 future를 그대로 기다림
+        self._index_future = _start_indexing(self._build_all_indices)
+        # 워커의 파싱 실패 메시지(future 결과)를 log_message로 출력했는지
+        self._index_warnings_logged = False
+        self.log_message(" Loading XML libraries in background...")
         
         self.log_message(" App initialization complete")
     
@@ -104,10 +387,10 @@ class CoordinateComparator:
     def load_atlas_size(self):
         """Load atlas image size from JSON"""
         try:
-            json_path = 'witchs_gift/font-atlas.json'
+            json_path = self.work_dir / 'witchs_gift' / 'font-atlas.json'
             if os.path.exists(json_path):
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # load_new_coordinates와 같은 캐시를 사용 (JSON 파싱은 파일당 한 번)
+                data = _load_json_cached(str(json_path), os.stat(json_path).st_mtime_ns)
                 if 'atlas' in data:
                     width = data['atlas'].get('width', 2048)
                     height = data['atlas'].get('height', 2048)
@@ -179,7 +462,7 @@ class CoordinateComparator:
                       fg_color=("gray70","gray30"), hover_color=("gray60","gray25"),
                       text_color=("gray10","gray90")).pack(side=tk.LEFT, padx=4)
         ctk.CTkButton(control_frame, text="Check File Paths", width=120,
-                      command=self.check_file_paths,
+                      command=self.check_file_paths_clicked,
                       fg_color=("gray70","gray30"), hover_color=("gray60","gray25"),
                       text_color=("gray10","gray90")).pack(side=tk.LEFT, padx=4)
 
@@ -260,8 +543,158 @@ class CoordinateComparator:
     def on_closing(self):
         """Called when window is closing."""
         self.log_message("Font Coordinate Viewer closing.")
+        self._flush_log()
+        # 공유 워커는 종료하지 않음 (다시 연 뷰어가 진행 중인 색인을 이어서 기다림)
+        for after_id in self._deferred.values():
+            self.root.after_cancel(after_id)
+        self._deferred.clear()
+        self._geom_intern.clear()
         self.root.destroy()
 
+    def _xml_entry(self, xml_path):
+        """Parse xml_path once; re-parse only when the file's mtime changes"""
+        key = str(xml_path)
+        mtime = os.stat(key).st_mtime_ns
+        with _CACHE_LOCK:
+            entry = self._xml_cache.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._xml_cache.move_to_end(key)
+                return entry
+        parsed = (mtime, ET.fromstring(_read_bytes(key), _xml_parser()), {})
+        with _CACHE_LOCK:
+            entry = self._xml_cache.get(key)
+            if entry is None or entry[0] != mtime:   # 다른 스레드가 먼저 넣었으면 그 트리를 사용
+                entry = parsed
+                self._xml_cache[key] = entry
+                if len(self._xml_cache) > XML_CACHE_SIZE:
+                    self._xml_cache.popitem(last=False)  # 가장 오래 쓰지 않은 트리 제거
+            else:
+                self._xml_cache.move_to_end(key)
+        return entry
+
+    def _xml_index(self, xml_path, tag, attr='id'):
+        """{attr value: first element} index of every tag element in xml_path"""
+        _, root, indexes = self._xml_entry(xml_path)
+        index = indexes.get((tag, attr))
+        if index is None:
+            index = {}
+            for elem in root.iter(tag):
+                index.setdefault(elem.get(attr), elem)
+            indexes[(tag, attr)] = index
+        return index
+
+    def _datablock_table(self, rib_path):
+        """{DATABLOCK id: datablock_record} of rib_path, streamed with iterparse (re-read when mtime changes)
+
+        Each DATABLOCK is cleared and detached once recorded, so the hex text and the tree
+        are not kept in memory.
+        """
+        key = str(rib_path)
+        mtime = os.stat(key).st_mtime_ns
+        with _CACHE_LOCK:
+            entry = _DATABLOCK_CACHE.get(key)
+            if entry is not None and entry[0] == mtime:
+                _DATABLOCK_CACHE.move_to_end(key)
+                return entry[1]
+        table = {}
+        for elem in _iter_datablocks(key):
+            block_id = elem.get('id')
+            if block_id not in table:
+                table[block_id] = datablock_record(elem)
+        with _CACHE_LOCK:
+            entry = _DATABLOCK_CACHE.get(key)
+            if entry is None or entry[0] != mtime:   # 다른 스레드가 먼저 넣었으면 그 표를 사용
+                entry = (mtime, table)
+                _DATABLOCK_CACHE[key] = entry
+                if len(_DATABLOCK_CACHE) > DATABLOCK_CACHE_SIZE:
+                    _DATABLOCK_CACHE.popitem(last=False)  # 가장 오래 쓰지 않은 표 제거
+            else:
+                _DATABLOCK_CACHE.move_to_end(key)
+        return entry[1]
+
+    def _datablock_vertices(self, rib_path, datablock_id):
+        """(positions, uvs) of a DATABLOCK in rib_path, or None after logging why it cannot be decoded
+
+        Shared by both coordinate loaders; the (immutable) result is kept on the DATABLOCK record,
+        so a glyph compared again is not unpacked twice.
+        """
+        datablock = self._datablock_table(rib_path).get(datablock_id)
+        if datablock is None:
+            self.log_message(f"[Error] DATABLOCK ID='{datablock_id}'not found.")
+            return None
+        vertices = datablock.get('vertices')
+        if vertices is not None:
+            return vertices
+        
+        byte_data = datablock['data']
+        if byte_data is None:
+            self.log_message("[Error] DATABLOCKDATA element not found.")
+            return None
+        self._debug_log(f"DATABLOCKDATA byte length: {len(byte_data)}")
+        self._debug_log(f"DATABLOCKDATA hex preview: {byte_data[:40].hex()}")
+        if not byte_data:
+            self.log_message("[Error] DATABLOCKDATAis empty.")
+            return None
+        
+        element_count = datablock['element_count']
+        stride = datablock['stride']
+        if element_count == 0 or stride == 0:
+            self.log_message(f"[Error] Invalid data: elementCount={element_count}, stride={stride}")
+            return None
+        self._debug_log(f"DATABLOCK ID: {datablock_id}")
+        self._debug_log(f"elementCount: {element_count}, stride: {stride}")
+        
+        # DATABLOCKSTREAM (Position과 UV 스트림)
+        pos_offset = datablock['pos_offset']
+        uv_offset = datablock['uv_offset']
+        if pos_offset is None or uv_offset is None:
+            self.log_message(f"[Error] Cannot find Position or UV stream. "
+                             f"(Position: {'Found' if pos_offset is not None else 'None'}, "
+                             f"UV: {'Found' if uv_offset is not None else 'None'})")
+            return None
+        self._debug_log(f" Position stream offset={pos_offset}, UV stream offset={uv_offset}")
+        
+        positions, uvs = unpack_vertices(byte_data, element_count, stride, pos_offset, uv_offset)
+        intern = self._geom_intern
+        vertices = (intern.setdefault(positions, positions), intern.setdefault(uvs, uvs))
+        datablock['vertices'] = vertices
+        return vertices
+
+    def _build_all_indices(self):
+        """Worker thread: parse the original and generated libraries and build their indexes
+
+        Touches no Tk state; returns the parse-failure messages for the Tk thread to log.
+        """
+        warnings = []
+        lib_dir = self.work_dir / 'witchs_gift' / 'generated_library'
+        targets = [
+            (self.font_paths['original_node'], 'RENDERNODE'),
+            (self.font_paths['original_segmentset'], 'RENDERDATASOURCE'),
+            (self.font_paths['original_renderinterfacebound'], 'DATABLOCK'),
+            (lib_dir / 'LIBRARY_NODE.xml', 'RENDERNODE'),
+            (lib_dir / 'LIBRARY_SEGMENTSET.xml', 'RENDERDATASOURCE'),
+            (lib_dir / 'LIBRARY_RENDERINTERFACEBOUND.xml', 'DATABLOCK'),
+        ]
+        for xml_path, tag in targets:
+            try:
+                if not os.path.exists(xml_path):
+                    continue
+                if tag == 'DATABLOCK':
+                    self._datablock_table(xml_path)
+                else:
+                    self._xml_index(xml_path, tag)
+            except Exception as e:
+                # 자세한 오류 로그는 메인 스레드의 로더가 다시 파싱하면서 출력
+                warnings.append(f"[Warning] Background parse failed ({xml_path}): {e}")
+        for source in ('original', 'new'):
+            metrics_path = self.font_paths[f'{source}_glyphmetrics']
+            try:
+                if os.path.exists(metrics_path):
+                    self._glyph_metrics_table(metrics_path, source)
+            except Exception as e:
+                warnings.append(f"[Warning] Background parse failed ({metrics_path}): {e}")
+        return warnings
+
     def load_font_metrics(self, source='original'):
         """Font metrics loading (NEFONTMETRICS)"""
         try:
@@ -274,10 +707,9 @@ class CoordinateComparator:
                 self.log_message(f"[Warning] Font metrics file not found: {metrics_path}")
                 return None
             
-            tree = ET.parse(metrics_path)
-            root = tree.getroot()
+            root = self._xml_entry(metrics_path)[1]
             
-            fontmetrics_elem = root.find('.//NEFONTMETRICS')
+            fontmetrics_elem = next(root.iter('NEFONTMETRICS'), None)  # 첫 번째 NEFONTMETRICS
             if fontmetrics_elem is None:
                 return None
             
@@ -298,6 +730,27 @@ class CoordinateComparator:
             self.log_message(f"[Error] Font metrics loading error ({source}): {e}")
             return None
     
+    def _glyph_metrics_table(self, metrics_path, source):
+        """{codePoint: metrics dict} of every NEGLYPHMETRICS, converted to numbers once per file"""
+        indexes = self._xml_entry(metrics_path)[2]
+        key = ('NEGLYPHMETRICS', 'metrics', source)
+        table = indexes.get(key)
+        if table is None:
+            table = {}
+            for codepoint, glyph_elem in self._xml_index(metrics_path, 'NEGLYPHMETRICS', 'codePoint').items():
+                get = glyph_elem.get
+                table[codepoint] = {
+                    'advanceWidth': float(get('advanceWidth', 0)),
+                    'horizontalBearing': float(get('horizontalBearing', 0)),
+                    'verticalBearing': float(get('verticalBearing', 0)),
+                    'physicalWidth': float(get('physicalWidth', 0)),
+                    'physicalHeight': float(get('physicalHeight', 0)),
+                    'codePoint': int(get('codePoint', 0)),
+                    'source': source
+                }
+            indexes[key] = table
+        return table
+
     def load_glyph_metrics(self, codepoint, source='original'):
         """Load individual glyph metrics (NEGLYPHMETRICS)"""
         try:
@@ -309,32 +762,8 @@ class CoordinateComparator:
             if not os.path.exists(metrics_path):
                 return None
             
-            # Check cache
-            cache_key = f"{source}_{codepoint}"
-            if cache_key in self.glyph_metrics:
-                return self.glyph_metrics[cache_key]
-            
-            tree = ET.parse(metrics_path)
-            root = tree.getroot()
-            
-            # codePoint로 NEGLYPHMETRICS 찾기
-            glyph_elem = root.find(f'.//NEGLYPHMETRICS[@codePoint="{codepoint}"]')
-            if glyph_elem is None:
-                return None
-            
-            metrics = {
-                'advanceWidth': float(glyph_elem.get('advanceWidth', 0)),
-                'horizontalBearing': float(glyph_elem.get('horizontalBearing', 0)),
-                'verticalBearing': float(glyph_elem.get('verticalBearing', 0)),
-                'physicalWidth': float(glyph_elem.get('physicalWidth', 0)),
-                'physicalHeight': float(glyph_elem.get('physicalHeight', 0)),
-                'codePoint': int(glyph_elem.get('codePoint', 0)),
-                'source': source
-            }
-            
-            # Store in cache
-            self.glyph_metrics[cache_key] = metrics
-            return metrics
+            # codePoint로 NEGLYPHMETRICS 찾기 (파일당 한 번 변환된 표에서 조회)
+            return self._glyph_metrics_table(metrics_path, source).get(str(codepoint))
             
         except Exception as e:
             self.log_message(f"[Warning] Glyph metrics loading error ({source}, {codepoint}): {e}")
@@ -343,12 +772,14 @@ class CoordinateComparator:
     def calculate_position_from_metrics(self, glyph_metrics, font_metrics):
         """Calculate Position coordinates from metrics"""
         scale = font_metrics['scale']
+        horizontal_bearing = glyph_metrics['horizontalBearing']
+        vertical_bearing = glyph_metrics['verticalBearing']
         
         # Calculate normalized coordinates
-        pos_left = glyph_metrics['horizontalBearing'] / scale
-        pos_right = (glyph_metrics['horizontalBearing'] + glyph_metrics['physicalWidth']) / scale
-        pos_top = glyph_metrics['verticalBearing'] / scale
-        pos_bottom = (glyph_metrics['verticalBearing'] - glyph_metrics['physicalHeight']) / scale
+        pos_left = horizontal_bearing / scale
+        pos_right = (horizontal_bearing + glyph_metrics['physicalWidth']) / scale
+        pos_top = vertical_bearing / scale
+        pos_bottom = (vertical_bearing - glyph_metrics['physicalHeight']) / scale
         
         # 4 vertices (top-left, bottom-left, bottom-right, top-right)
         positions = [
@@ -413,17 +844,33 @@ class CoordinateComparator:
         self.canvas.delete("all")
         # Clear image cache
         self.tk_images.clear()
+        self.item_info.clear()
+        self._drawn_state = None
+        self._layout_size = None
+
+    def clear_glyph_items(self):
+        """Remove only glyph items; the 'layout' items stay for the next draw."""
+        self.canvas.delete('original', 'new')
+        self.tk_images.clear()
+        self.item_info.clear()
+        self._drawn_state = None
     
     def on_canvas_resize(self, event):
-        """Called on canvas resize - redraws content to fit current size"""
-        # Store new canvas size
-        new_width = event.width
-        new_height = event.height
-        
+        """Called on canvas resize - redraws once the size stops changing"""
         # Ignore if size is too small
-        if new_width < 100 or new_height < 100:
+        if event.width < 100 or event.height < 100:
             return
         
+        # 창 드래그 중 연속 발생하는 <Configure>는 마지막 크기만 반영
+        if self._resize_after is not None:
+            self.root.after_cancel(self._resize_after)
+        self._resize_after = self.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize,
+                                             event.width, event.height)
+    
+    def _apply_resize(self, new_width, new_height):
+        """Store the settled canvas size and redraw content to fit it"""
+        self._resize_after = None
+        
         # Update canvas size
         self.canvas_width = new_width
         self.canvas_height = new_height
@@ -434,10 +881,16 @@ class CoordinateComparator:
     
     def draw_canvas_layout(self):
         """Draw Canvas layout (title, UV box, grid, crosshair)"""
+        # 레이아웃은 캔버스 크기에만 의존하므로 크기가 같으면 기존 아이템 유지
+        if self._layout_size == (self.canvas_width, self.canvas_height):
+            return
+        self.canvas.delete('layout')
+        self._layout_size = (self.canvas_width, self.canvas_height)
+        
         # Title
         self.canvas.create_text(self.canvas_width//2, 20, 
                                text=f"Position coordinates comparison (origin at center, solid=Original, dashed=new file)", 
-                               fill='black', font=('Arial', 14, 'bold'))
+                               fill='black', font=('Arial', 14, 'bold'), tags='layout')
         
         # UV comparison box
         origin_x = self.canvas_width // 2
@@ -449,13 +902,13 @@ class CoordinateComparator:
         uv_box_y2 = origin_y
         
         self.canvas.create_rectangle(uv_box_x1, uv_box_y1, uv_box_x2, uv_box_y2, 
-                                    outline='#AAAAAA', width=2, dash=(5, 3))
+                                    outline='#AAAAAA', width=2, dash=(5, 3), tags='layout')
         self.canvas.create_text(uv_box_x1 + 5, uv_box_y1 + 5, 
                                text=f"[UV coordinates comparison] {self.atlas_width}x{self.atlas_height}", 
-                               fill='#666666', font=('Arial', 9, 'bold'), anchor='nw')
+                               fill='#666666', font=('Arial', 9, 'bold'), anchor='nw', tags='layout')
         self.canvas.create_text((uv_box_x1 + uv_box_x2) // 2, uv_box_y2 - 10, 
                                text="solid=Original | dashed=new", 
-                               fill='#999999', font=('Arial', 7), anchor='center')
+                               fill='#999999', font=('Arial', 7), anchor='center', tags='layout')
         
         # Draw grid
         self.draw_grid()
@@ -468,10 +921,24 @@ class CoordinateComparator:
         if not self.loaded_data:
             return
         
-        # Clear canvas and redraw (no file loading)
-        self.clear_canvas()
+        # 크기/baseline 변환이 그대로고 필요한 글자 이미지가 이미 그려져 있으면
+        # 표시 여부만 태그 단위로 변경
+        drawn = self._drawn_state
+        use_transformed = self.apply_baseline_transform.get()
+        if (drawn is not None
+                and drawn[:2] == (self.canvas_width, self.canvas_height)
+                and (drawn[3] or not self.show_glyph_image.get())):
+            # baseline 변환만 바뀌었으면 Position 아이템을 글자별로 이동 (재생성 없음)
+            if drawn[2] != use_transformed:
+                self.shift_position_items(use_transformed)
+                self._drawn_state = (drawn[0], drawn[1], use_transformed, drawn[3])
+            self.apply_visibility()
+            return
         
-        # Redraw title and grid
+        # Clear glyph items and redraw (no file loading)
+        self.clear_glyph_items()
+        
+        # Redraw title and grid (only when the canvas size changed)
         self.draw_canvas_layout()
         
         # Render with stored data
@@ -479,69 +946,109 @@ class CoordinateComparator:
     
     def render_loaded_data(self):
         """Render with stored data"""
+        # 두 박스가 모두 꺼져 있으면 그릴 것이 없음 (_drawn_state가 None이라 다시 켤 때 그려짐)
+        if not (self.show_original.get() or self.show_new.get()):
+            return
+        
         # UV rendering settings
         pos_origin_x = self.canvas_width // 2
         pos_origin_y = self.canvas_height // 2
         uv_offset_x = pos_origin_x - self.uv_box_width + 10
         uv_offset_y = pos_origin_y - self.uv_box_height + 30
         uv_scale = min(self.uv_box_width, self.uv_box_height) - 20
+
+        # 모든 아이템을 태그('original'/'new', 이미지는 'glyph' 추가)와 함께 그리고
+        # 체크박스 상태는 apply_visibility()로 반영
+        use_transformed = self.apply_baseline_transform.get()  # Position Y 변환 여부
+        draw_glyphs = self.show_glyph_image.get()  # 꺼져 있으면 atlas crop/resize 생략
+        positions = self._positions
+        draw_rectangle = self.draw_rectangle
+        draw_position_rectangle = self.draw_position_rectangle
+        render_glyph_image = self.render_glyph_image
         
         for codepoint, data in self.loaded_data.items():
             color = data['color']
-            char = chr(codepoint) if codepoint < 0x110000 else '?'
+            char = data['char']
             original_data = data.get('original')
             new_data = data.get('new')
             
-            # 체크박스 상태에 따라 UV coordinates 그리기
-            if self.show_original.get() and original_data:
-                self.draw_rectangle(original_data['uvs'], color, f"{char}", codepoint, "Original", 
-                                  uv_offset_x, uv_offset_y, style='solid', scale=uv_scale)
-            if self.show_new.get() and new_data:
-                self.draw_rectangle(new_data['uvs'], color, f"{char}", codepoint, "New", 
-                                  uv_offset_x, uv_offset_y, style='dashed', scale=uv_scale)
-            
-            # Position Y 변환 체크박스 상태에 따라 coordinates 선택
-            use_transformed = self.apply_baseline_transform.get()
-            
-            # 체크박스 상태에 따라 Position coordinates 그리기
-            if self.show_original.get() and original_data:
-                positions = original_data['positions_transformed'] if use_transformed else original_data['positions_raw']
-                self.draw_position_rectangle(positions, original_data['uvs'], None, 
-                                            color, f"{char}", codepoint, "Original", 
-                                            pos_origin_x, pos_origin_y, style='solid', 
-                                            source=original_data.get('source', 'original'))
-            if self.show_new.get() and new_data:
-                positions = new_data['positions_transformed'] if use_transformed else new_data['positions_raw']
-                self.draw_position_rectangle(positions, new_data['uvs'], None, 
-                                            color, f"{char}", codepoint, "New", 
-                                            pos_origin_x, pos_origin_y, style='dashed', 
-                                            source=new_data.get('source', 'generated_library'))
-            
-            # 체크박스 상태에 따라 글자 이미지 렌더링
-            if self.show_glyph_image.get():
-                if self.show_original.get() and original_data:
-                    positions = original_data['positions_transformed'] if use_transformed else original_data['positions_raw']
-                    self.render_glyph_image(
-                        positions,
-                        original_data['uvs'],
-                        original_data.get('texture'),
-                        pos_origin_x,
-                        pos_origin_y,
-                        source='original'
-                    )
-                if self.show_new.get() and new_data:
-                    positions = new_data['positions_transformed'] if use_transformed else new_data['positions_raw']
-                    self.render_glyph_image(
-                        positions,
-                        new_data['uvs'],
-                        new_data.get('texture'),
-                        pos_origin_x,
-                        pos_origin_y,
-                        source='new'
-                    )
+            # UV coordinates 그리기
+            if original_data:
+                draw_rectangle(original_data['uvs'], color, char, codepoint, "Original", 
+                               uv_offset_x, uv_offset_y, style='solid', scale=uv_scale,
+                               tags=('original',))
+            if new_data:
+                draw_rectangle(new_data['uvs'], color, char, codepoint, "New", 
+                               uv_offset_x, uv_offset_y, style='dashed', scale=uv_scale,
+                               tags=('new',))
+            
+            # Position coordinates 그리기
+            if original_data:
+                original_positions = positions(original_data, use_transformed)
+                draw_position_rectangle(original_positions, original_data['uvs'], None, 
+                                        color, char, codepoint, "Original", 
+                                        pos_origin_x, pos_origin_y, style='solid', 
+                                        source=original_data.get('source', 'original'),
+                                        tags=('original', f'pos-{codepoint}-original'))
+            if new_data:
+                new_positions = positions(new_data, use_transformed)
+                draw_position_rectangle(new_positions, new_data['uvs'], None, 
+                                        color, char, codepoint, "New", 
+                                        pos_origin_x, pos_origin_y, style='dashed', 
+                                        source=new_data.get('source', 'generated_library'),
+                                        tags=('new', f'pos-{codepoint}-new'))
+            
+            # 글자 이미지 렌더링
+            if not draw_glyphs:
+                continue
+            if original_data:
+                render_glyph_image(original_positions, original_data['uvs'],
+                                   original_data.get('texture'), pos_origin_x, pos_origin_y,
+                                   source='original', tags=('original', 'glyph', f'pos-{codepoint}-original'))
+            if new_data:
+                render_glyph_image(new_positions, new_data['uvs'],
+                                   new_data.get('texture'), pos_origin_x, pos_origin_y,
+                                   source='new', tags=('new', 'glyph', f'pos-{codepoint}-new'))
+        
+        self._drawn_state = (self.canvas_width, self.canvas_height, use_transformed, draw_glyphs)
+        self.apply_visibility()
         
         # 모든 렌더링 완료 후 UI 업데이트
         self.root.update_idletasks()
+
+    def shift_position_items(self, use_transformed):
+        """baseline 변환 토글 시 글자별 Position 아이템('pos-<codepoint>-<source>' 태그)을 Y로만 이동
+
+        변환은 글자마다 Y를 같은 값만큼 옮기므로, 첫 정점의 raw/변환 차이만큼 이동하면 다시 그린 것과 같습니다.
+        """
+        scale = self.grid_scale
+        for codepoint, data in self.loaded_data.items():
+            for source in ('original', 'new'):
+                source_data = data.get(source)
+                if not source_data:
+                    continue
+                raw_y = source_data['positions_raw'][0][1]
+                transformed_y = self._positions(source_data, True)[0][1]
+                dy = (raw_y - transformed_y) * scale  # 캔버스 Y는 위가 -
+                self.canvas.move(f'pos-{codepoint}-{source}', 0, dy if use_transformed else -dy)
+
+    def _positions(self, data, use_transformed):
+        """Raw or baseline-transformed positions of loaded data (transformed computed once, on first use)"""
+        if not use_transformed:
+            return data['positions_raw']
+        transformed = data['positions_transformed']
+        if transformed is None:
+            source = 'new' if data['source'] == 'generated_library' else 'original'
+            transformed = self.convert_position_to_baseline(data['positions_raw'], data['codepoint'], source)
+            data['positions_transformed'] = transformed
+        return transformed
+
+    def apply_visibility(self):
+        """체크박스 상태를 태그 단위로 캔버스에 반영 (아이템 재생성 없음)"""
+        self.canvas.itemconfigure('original', state='normal' if self.show_original.get() else 'hidden')
+        self.canvas.itemconfigure('new', state='normal' if self.show_new.get() else 'hidden')
+        if not self.show_glyph_image.get():
+            self.canvas.itemconfigure('glyph', state='hidden')
         
     def convert_position_to_baseline(self, positions, codepoint, source='original'):
         """Position coordinates를 baseline 기준으로 변환
@@ -580,12 +1087,13 @@ class CoordinateComparator:
             # 정규화: verticalBearing / scale
             baseline_to_top = vertical_bearing / scale
             
-            # 디버깅: coordinates 출력
+            # 디버깅 로그는 모아서 log_message 한 번으로 출력
+            lines = []
             if positions:
-                self.log_message(f"    Before transform {source} Position (codePoint={codepoint}):")
-                self.log_message(f"       Top-left: ({positions[0][0]:.4f}, {positions[0][1]:.4f})")
+                lines.append(f"    Before transform {source} Position (codePoint={codepoint}):")
+                lines.append(f"       Top-left: ({positions[0][0]:.4f}, {positions[0][1]:.4f})")
                 if len(positions) > 1:
-                    self.log_message(f"       Bottom-left: ({positions[1][0]:.4f}, {positions[1][1]:.4f})")
+                    lines.append(f"       Bottom-left: ({positions[1][0]:.4f}, {positions[1][1]:.4f})")
             
             # 각 글자의 상단 Y 위치 (좌상단 또는 우상단)
             top_y = positions[0][1] if positions else 0.0
@@ -593,23 +1101,20 @@ class CoordinateComparator:
             # baseline 위치 = 상단 - verticalBearing
             baseline_y = top_y - baseline_to_top
             
-            self.log_message(f"    {source} top Y={top_y:.4f}")
-            self.log_message(f"    {source} baseline Y={baseline_y:.4f} (top - verticalBearing)")
+            lines.append(f"    {source} top Y={top_y:.4f}")
+            lines.append(f"    {source} baseline Y={baseline_y:.4f} (top - verticalBearing)")
             
-            converted_positions = []
-            for pos in positions:
-                # baseline을 Y=0으로 이동
-                # new_Y = Y - baseline_Y
-                new_y = pos[1] - baseline_y
-                converted_positions.append((pos[0], new_y, pos[2]))
+            # baseline을 Y=0으로 이동: new_Y = Y - baseline_Y
+            converted_positions = tuple((x, y - baseline_y, z) for x, y, z in positions)
             
             # 디버깅: 변환 후 coordinates 출력
             if converted_positions:
-                self.log_message(f"     After transform Position:")
-                self.log_message(f"       Top-left: ({converted_positions[0][0]:.4f}, {converted_positions[0][1]:.4f})")
+                lines.append(f"     After transform Position:")
+                lines.append(f"       Top-left: ({converted_positions[0][0]:.4f}, {converted_positions[0][1]:.4f})")
                 if len(converted_positions) > 1:
-                    self.log_message(f"       Bottom-left: ({converted_positions[1][0]:.4f}, {converted_positions[1][1]:.4f})")
+                    lines.append(f"       Bottom-left: ({converted_positions[1][0]:.4f}, {converted_positions[1][1]:.4f})")
             
+            self.log_message("\n".join(lines))
             return converted_positions
             
         except Exception as e:
@@ -625,23 +1130,16 @@ class CoordinateComparator:
                 self.log_message(f"[Error] File not found: {original_xml_path}")
                 return None
                 
-            tree = ET.parse(original_xml_path)
-            root = tree.getroot()
-            
             # 지정된 코드포인트의 노드 찾기
-            target_node = None
-            for node in root.findall('.//RENDERNODE'):
-                if node.get('id') == str(codepoint):
-                    target_node = node
-                    break
+            target_node = self._xml_index(original_xml_path, 'RENDERNODE').get(str(codepoint))
             
-            if not target_node:
+            if target_node is None:
                 self.log_message(f"[Error] RENDERNODE with ID='{codepoint}' not found in original file.")
                 return None
             
             # Original 파일은 RENDERSTREAMINSTANCE 구조 사용
-            renderstream = target_node.find('.//RENDERSTREAMINSTANCE')
-            if not renderstream:
+            renderstream = target_node.find('RENDERSTREAMINSTANCE')  # RENDERNODE의 직계 자식
+            if renderstream is None:
                 self.log_message("[Error] RENDERSTREAMINSTANCEnot found.")
                 return None
             
@@ -659,21 +1157,18 @@ class CoordinateComparator:
                 self.log_message(f"[Error] File not found: {segmentset_path}")
                 return None
                 
-            segmentset_tree = ET.parse(segmentset_path)
-            segmentset_root = segmentset_tree.getroot()
-            
             # RENDERDATASOURCE 찾기
-            self.log_message(f"RENDERDATASOURCE ID '{renderdatasource_id}' Searching...")
-            renderdatasource = segmentset_root.find(f'.//RENDERDATASOURCE[@id="{renderdatasource_id}"]')
-            if not renderdatasource:
+            self._debug_log(f"RENDERDATASOURCE ID '{renderdatasource_id}' Searching...")
+            renderdatasource = self._xml_index(segmentset_path, 'RENDERDATASOURCE').get(renderdatasource_id)
+            if renderdatasource is None:
                 self.log_message(f"[Error] RENDERDATASOURCE ID='{renderdatasource_id}'not found.")
                 return None
-            self.log_message(f" RENDERDATASOURCE ID='{renderdatasource_id}' Found!")
+            self._debug_log(f" RENDERDATASOURCE ID='{renderdatasource_id}' Found!")
             
             # RENDERSTREAM들 찾기 (subStream="0"과 subStream="1")
-            self.log_message("Searching RENDERSTREAMs...")
-            renderstreams = renderdatasource.findall('./RENDERSTREAM')
-            self.log_message(f"Found RENDERSTREAM count: {len(renderstreams)}")
+            self._debug_log("Searching RENDERSTREAMs...")
+            renderstreams = renderdatasource.findall('RENDERSTREAM')
+            self._debug_log(f"Found RENDERSTREAM count: {len(renderstreams)}")
             
             if not renderstreams:
                 self.log_message("[Error] Cannot find RENDERSTREAM.")
@@ -686,21 +1181,21 @@ class CoordinateComparator:
             for i, stream in enumerate(renderstreams):
                 sub_stream = stream.get('subStream')
                 data_block = stream.get('dataBlock')
-                self.log_message(f"RENDERSTREAM {i}: subStream='{sub_stream}' (type: {type(sub_stream)}), dataBlock='{data_block}'")
+                self._debug_log(f"RENDERSTREAM {i}: subStream='{sub_stream}' (type: {type(sub_stream)}), dataBlock='{data_block}'")
                 
                 if sub_stream == '0' or sub_stream == 0:
                     position_stream = stream
-                    self.log_message(f" Position stream found: dataBlock='{data_block}'")
+                    self._debug_log(f" Position stream found: dataBlock='{data_block}'")
                 elif sub_stream == '1' or sub_stream == 1:
                     uv_stream = stream
-                    self.log_message(f" UV stream found: dataBlock='{data_block}'")
+                    self._debug_log(f" UV stream found: dataBlock='{data_block}'")
             
-            self.log_message(f"Final check - Position stream: {'Found' if position_stream else 'None'}")
-            self.log_message(f"Final check - UV stream: {'Found' if uv_stream else 'None'}")
-            self.log_message(f"position_stream value: {position_stream}")
-            self.log_message(f"uv_stream value: {uv_stream}")
-            self.log_message(f"position_stream is None: {position_stream is None}")
-            self.log_message(f"uv_stream is None: {uv_stream is None}")
+            self._debug_log(f"Final check - Position stream: {'Found' if position_stream is not None else 'None'}")
+            self._debug_log(f"Final check - UV stream: {'Found' if uv_stream is not None else 'None'}")
+            self._debug_log(f"position_stream value: {position_stream}")
+            self._debug_log(f"uv_stream value: {uv_stream}")
+            self._debug_log(f"position_stream is None: {position_stream is None}")
+            self._debug_log(f"uv_stream is None: {uv_stream is None}")
             
             if position_stream is None or uv_stream is None:
                 self.log_message("[Error] Cannot find Position or UV stream.")
@@ -714,12 +1209,12 @@ class CoordinateComparator:
                 self.log_message("[Error] dataBlock attribute not found.")
                 return None
             
-            self.log_message(f"Original dataBlock ID: {datablock_id}")
+            self._debug_log(f"Original dataBlock ID: {datablock_id}")
             
             if datablock_id.startswith('#'):
                 datablock_id = datablock_id[1:]
             
-            self.log_message(f"Processed dataBlock ID: {datablock_id}")
+            self._debug_log(f"Processed dataBlock ID: {datablock_id}")
             
             # DATABLOCK 찾기
             datablock_path = self.font_paths['original_renderinterfacebound']
@@ -727,115 +1222,24 @@ class CoordinateComparator:
                 self.log_message(f"[Error] File not found: {datablock_path}")
                 return None
                 
-            datablock_tree = ET.parse(datablock_path)
-            datablock_root = datablock_tree.getroot()
-            
-            # DATABLOCK 찾기
-            datablock = datablock_root.find(f'.//DATABLOCK[@id="{datablock_id}"]')
-            if not datablock:
-                self.log_message(f"[Error] DATABLOCK ID='{datablock_id}'not found.")
-                return None
-            
-            data_elem = datablock.find('./DATABLOCKDATA')
-            if data_elem is None:
-                self.log_message("[Error] DATABLOCKDATA element not found.")
-                return None
-            
-            # 데이터 텍스트 추출 및 정리
-            raw_text = data_elem.text or ''
-            hex_data = raw_text.replace(' ', '').replace('\n', '').replace('\t', '').replace('\r', '')
-            
-            self.log_message(f"DATABLOCKDATA Original length: {len(raw_text)}")
-            self.log_message(f"DATABLOCKDATA hex length: {len(hex_data)}")
-            self.log_message(f"DATABLOCKDATA hex preview: {hex_data[:80]}")
-            
-            if not hex_data:
-                self.log_message("[Error] DATABLOCKDATAis empty.")
-                return None
-                
-            byte_data = bytes.fromhex(hex_data)
-            
-            element_count = int(datablock.get('elementCount', 0))
-            stride_attr = datablock.get('stride')
-            self.log_message(f"DATABLOCK attributes: elementCount={element_count}, stride attribute={stride_attr}")
-            
-            # stride 속성이 없으면 DATABLOCKSTREAM에서 가져옵니다
-            if stride_attr:
-                stride = int(stride_attr)
-            else:
-                # DATABLOCKSTREAM에서 stride 찾기
-                stream = datablock.find('./DATABLOCKSTREAM')
-                if stream is not None:
-                    stride = int(stream.get('stride', 0))
-                    self.log_message(f"Stride found in DATABLOCKSTREAM: {stride}")
-                else:
-                    stride = 0
-            
-            if element_count == 0 or stride == 0:
-                self.log_message(f"[Error] Invalid data: elementCount={element_count}, stride={stride}")
-                return None
-            
-            # DATABLOCKSTREAM 찾기 (Position과 UV 스트림)
-            self.log_message(f"DATABLOCK ID: {datablock_id}")
-            self.log_message(f"elementCount: {element_count}, stride: {stride}")
-            
-            position_stream_elem = datablock.find('./DATABLOCKSTREAM[@renderType="Vertex"]')
-            uv_stream_elem = datablock.find('./DATABLOCKSTREAM[@renderType="ST"]')
-            
-            # 디버깅 정보 추가
-            self.log_message(f"DATABLOCK ID: {datablock_id}")
-            self.log_message(f"elementCount: {element_count}, stride: {stride}")
-            
-            if position_stream_elem is not None:
-                self.log_message(f" Position stream found: offset={position_stream_elem.get('offset')}")
-            else:
-                self.log_message("[Error] Cannot find Position stream.")
-                
-            if uv_stream_elem is not None:
-                self.log_message(f" UV stream found: offset={uv_stream_elem.get('offset')}")
-            else:
-                self.log_message("[Error] Cannot find UV stream.")
-                
-            if position_stream_elem is None or uv_stream_elem is None:
-                self.log_message("[Error] Cannot find Position or UV stream.")
+            # DATABLOCK에서 coordinates 추출
+            vertices = self._datablock_vertices(datablock_path, datablock_id)
+            if vertices is None:
                 return None
-            
-            pos_offset = int(position_stream_elem.get('offset', 0))
-            uv_offset = int(uv_stream_elem.get('offset', 0))
-            
-            # coordinates 추출
-            positions = []
-            uvs = []
-            
-            for i in range(element_count):
-                try:
-                    # Position coordinates
-                    pos_position = (i * stride) + pos_offset
-                    if pos_position + 12 > len(byte_data):  # 3 * 4 bytes
-                        break
-                    x, y, z = struct.unpack_from('>fff', byte_data, pos_position)
-                    positions.append((x, y, z))
-                    
-                    # UV coordinates
-                    uv_position = (i * stride) + uv_offset
-                    if uv_position + 8 > len(byte_data):  # 2 * 4 bytes
-                        break
-                    u, v = struct.unpack_from('>ff', byte_data, uv_position)
-                    uvs.append((u, v))
-                    
-                except struct.error as e:
-                    self.log_message(f"[Warning] Struct unpacking error at vertex {i}: {e}")
-                    break
+            positions, uvs = vertices
             
             # 텍스처 파일명 추출
             texture_filename = None
-            renderstream_inst = target_node.find('.//RENDERSTREAMINSTANCE[@shader]')
-            if renderstream_inst is not None:
+            # shader 속성이 있는 첫 RENDERSTREAMINSTANCE (직계 자식만 훑음)
+            for renderstream_inst in target_node.iterfind('RENDERSTREAMINSTANCE'):
                 shader_id = renderstream_inst.get('shader')
+                if shader_id is None:
+                    continue
                 if shader_id:
                     # shader="#din_cnd_bold_msdf_0" -> din_cnd_bold_msdf_0.png
                     texture_filename = shader_id.strip('#') + '.png'
-                    self.log_message(f"Texture file: {texture_filename}")
+                    self._debug_log(f"Texture file: {texture_filename}")
+                break
             
             if not texture_filename:
                 texture_filename = 'din_cnd_bold_msdf_0.png'  # fallback
@@ -844,12 +1248,10 @@ class CoordinateComparator:
             if positions and uvs:
                 self.log_message(f" Original Coordinates loaded successfully: {len(positions)}vertices")
                 
-                # raw와 transformed coordinates 모두 저장 (체크박스 토글용)
-                transformed_positions = self.convert_position_to_baseline(positions, codepoint, 'original')
-                
+                # baseline 변환 좌표는 처음 필요할 때 계산 (self._positions 참고)
                 return {
                     'positions_raw': positions,
-                    'positions_transformed': transformed_positions,
+                    'positions_transformed': None,
                     'uvs': uvs,
                     'texture': texture_filename,
                     'source': 'original',
@@ -877,23 +1279,16 @@ class CoordinateComparator:
                 self.log_message(f"[Error] Cannot find library XML: {lib_dir}")
                 return None
 
-            node_tree = ET.parse(node_path)
-            node_root = node_tree.getroot()
-
             # RENDERNODE 찾기
-            target_node = None
-            for node in node_root.findall('.//RENDERNODE'):
-                if node.get('id') == str(codepoint):
-                    target_node = node
-                    break
+            target_node = self._xml_index(node_path, 'RENDERNODE').get(str(codepoint))
 
-            if not target_node:
+            if target_node is None:
                 self.log_message(f"[Error] RENDERNODE with ID='{codepoint}' not found in '{lib_dir}'.")
                 return None
 
             # RENDERSTREAMINSTANCE -> indices
-            renderstream = target_node.find('.//RENDERSTREAMINSTANCE')
-            if not renderstream:
+            renderstream = target_node.find('RENDERSTREAMINSTANCE')  # RENDERNODE의 직계 자식
+            if renderstream is None:
                 self.log_message("[Error] RENDERSTREAMINSTANCEnot found.")
                 return None
 
@@ -901,15 +1296,13 @@ class CoordinateComparator:
             if datasource_id.startswith('#'):
                 datasource_id = datasource_id[1:]
 
-            seg_tree = ET.parse(seg_path)
-            seg_root = seg_tree.getroot()
-            datasource = seg_root.find(f'.//RENDERDATASOURCE[@id="{datasource_id}"]')
-            if not datasource:
+            datasource = self._xml_index(seg_path, 'RENDERDATASOURCE').get(datasource_id)
+            if datasource is None:
                 self.log_message(f"[Error] RENDERDATASOURCE ID='{datasource_id}'not found.")
                 return None
 
             # DATABLOCK ID 추출 (subStream=0/1 중 아무거나의 dataBlock)
-            streams = datasource.findall('./RENDERSTREAM')
+            streams = datasource.findall('RENDERSTREAM')
             if not streams:
                 self.log_message("[Error] No RENDERSTREAM.")
                 return None
@@ -923,66 +1316,18 @@ class CoordinateComparator:
                 self.log_message("[Error] dataBlock IDnot found.")
                 return None
 
-            rib_tree = ET.parse(rib_path)
-            rib_root = rib_tree.getroot()
-            datablock = rib_root.find(f'.//DATABLOCK[@id="{datablock_id}"]')
-            if not datablock:
-                self.log_message(f"[Error] DATABLOCK ID='{datablock_id}'not found.")
-                return None
-
-            data_elem = datablock.find('./DATABLOCKDATA')
-            if data_elem is None or (data_elem.text or '').strip() == '':
-                self.log_message("[Error] DATABLOCKDATAis empty.")
-                return None
-
-            hex_data = (data_elem.text or '').replace(' ', '').replace('\n', '').replace('\t', '').replace('\r', '')
-            byte_data = bytes.fromhex(hex_data)
-
-            element_count = int(datablock.get('elementCount', 0))
-            # stride는 DATABLOCKSTREAM stride 사용 (없으면 DATABLOCK stride)
-            stride_attr = datablock.get('stride')
-            if stride_attr:
-                stride = int(stride_attr)
-            else:
-                stream_any = datablock.find('./DATABLOCKSTREAM')
-                stride = int(stream_any.get('stride', 0)) if stream_any is not None else 0
-            if element_count == 0 or stride == 0:
-                self.log_message(f"[Error] Invalid data: elementCount={element_count}, stride={stride}")
-                return None
-
-            pos_stream = datablock.find('./DATABLOCKSTREAM[@renderType="Vertex"]')
-            uv_stream = datablock.find('./DATABLOCKSTREAM[@renderType="ST"]')
-            if pos_stream is None or uv_stream is None:
-                self.log_message("[Error] Cannot find Position or UV stream.")
+            vertices = self._datablock_vertices(rib_path, datablock_id)
+            if vertices is None:
                 return None
-
-            pos_offset = int(pos_stream.get('offset', 0))
-            uv_offset = int(uv_stream.get('offset', 0))
-
-            positions = []
-            uvs = []
-            for i in range(element_count):
-                base = i * stride
-                if base + pos_offset + 12 > len(byte_data):
-                    break
-                x, y, z = struct.unpack_from('>fff', byte_data, base + pos_offset)
-                positions.append((x, y, z))
-
-                if base + uv_offset + 8 > len(byte_data):
-                    break
-                u, v = struct.unpack_from('>ff', byte_data, base + uv_offset)
-                uvs.append((u, v))
+            positions, uvs = vertices
 
             if positions and uvs:
                 self.log_message(f" '{lib_dir}' Coordinates loaded successfully: {len(positions)}vertices")
                 
-                # raw와 transformed coordinates 모두 저장 (체크박스 토글용)
-                source = 'new' if is_test_output else 'original'
-                transformed_positions = self.convert_position_to_baseline(positions, codepoint, source)
-                
+                # baseline 변환 좌표는 처음 필요할 때 계산 (self._positions 참고)
                 return { 
                     'positions_raw': positions,
-                    'positions_transformed': transformed_positions,
+                    'positions_transformed': None,
                     'uvs': uvs, 
                     'texture': None,
                     'source': 'generated_library' if is_test_output else 'original',
@@ -1007,24 +1352,21 @@ class CoordinateComparator:
                     return xml_data
 
             # JSON 데이터 로드
-            json_path = 'witchs_gift/font-atlas.json'
+            json_path = self.font_paths['new_json']
             if not os.path.exists(json_path):
                 self.log_message(f"[Error] File not found: {json_path}")
                 return None
                 
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 글리프마다 호출되므로 파일이 바뀌지 않았으면 파싱 결과 재사용
+            json_key = (str(json_path), os.stat(json_path).st_mtime_ns)
+            data = _load_json_cached(*json_key)
             
             if 'glyphs' not in data:
                 self.log_message("[Error] JSON file missing 'glyphs' key.")
                 return None
             
-            # 지정된 코드포인트의 글리프 찾기
-            target_glyph = None
-            for glyph in data['glyphs']:
-                if glyph.get('unicode') == codepoint:
-                    target_glyph = glyph
-                    break
+            # 지정된 코드포인트의 글리프 찾기 (unicode 색인 조회)
+            target_glyph = _json_glyph_index(*json_key).get(codepoint)
             
             if not target_glyph:
                 self.log_message(f"[Error] Glyph with codepoint {codepoint} not found in new file.")
@@ -1058,12 +1400,14 @@ class CoordinateComparator:
                 return None
             
             # UV coordinates: DirectX 스타일 (V=0이 상단, V=1이 하단)
-            # Original XML도 DirectX 스타일이므로 그대로 사용
+            # Original XML도 DirectX 스타일이므로 그대로 사용 (각 경계는 한 번만 나눔)
+            u_left, u_right = ab['left'] / atlas_width, ab['right'] / atlas_width
+            v_top, v_bottom = ab['top'] / atlas_height, ab['bottom'] / atlas_height
             uvs = [
-                (ab['left'] / atlas_width, ab['top'] / atlas_height),      # 좌상 -> top (작은 V)
-                (ab['left'] / atlas_width, ab['bottom'] / atlas_height),   # 좌하 -> bottom (큰 V)
-                (ab['right'] / atlas_width, ab['bottom'] / atlas_height),  # 우하 -> bottom (큰 V)
-                (ab['right'] / atlas_width, ab['top'] / atlas_height),     # 우상 -> top (작은 V)
+                (u_left, v_top),      # 좌상 -> top (작은 V)
+                (u_left, v_bottom),   # 좌하 -> bottom (큰 V)
+                (u_right, v_bottom),  # 우하 -> bottom (큰 V)
+                (u_right, v_top),     # 우상 -> top (작은 V)
             ]
             
             self.log_message(f" New Coordinates loaded successfully: {len(positions)} vertices")
@@ -1083,24 +1427,21 @@ class CoordinateComparator:
             
         return None
     
-    def draw_rectangle(self, coords, color, label, codepoint, info_prefix, offset_x=0, offset_y=0, style='solid', scale=200):
+    def draw_rectangle(self, coords, color, label, codepoint, info_prefix, offset_x=0, offset_y=0, style='solid', scale=200, tags=()):
         """UV coordinates로 투명 사각형 그리기"""
         if len(coords) < 4:
             self.log_message(f"[Error] {label}: less than 4 coordinates ({len(coords)})")
             return None
         
-        # coordinates를 캔버스 coordinates로 변환 (UV는 0~1 범위)
-        canvas_coords = []
-        for i, coord in enumerate(coords):
-            x = coord[0] * scale + offset_x
-            y = coord[1] * scale + offset_y
-            canvas_coords.extend([x, y])
+        # coordinates를 캔버스 coordinates로 변환 (UV는 0~1 범위, create_polygon용 평탄 리스트)
+        canvas_coords = [c for coord in coords
+                         for c in (coord[0] * scale + offset_x, coord[1] * scale + offset_y)]
 
         # 스타일에 따라 실선 또는 점선으로 그리기
         if style == 'dashed':
-            rect_id = self.canvas.create_polygon(canvas_coords, outline=color, width=2, fill='', dash=(6, 3))
+            rect_id = self.canvas.create_polygon(canvas_coords, outline=color, width=2, fill='', dash=(6, 3), tags=tags)
         else: # solid
-            rect_id = self.canvas.create_polygon(canvas_coords, outline=color, width=2, fill='')
+            rect_id = self.canvas.create_polygon(canvas_coords, outline=color, width=2, fill='', tags=tags)
 
         # 라벨 추가 (점선일 경우 라벨 위치 조정)
         center_x = sum(canvas_coords[::2]) / 4
@@ -1108,7 +1449,7 @@ class CoordinateComparator:
         label_offset = 7 if style == 'dashed' else -7
         
         text_id = self.canvas.create_text(center_x, center_y + label_offset, text=label, 
-                                         fill=color, font=('Arial', 9, 'bold'))
+                                         fill=color, font=self._uv_label_font, tags=tags)
         
         # 클릭 정보를 위해 ID와 정보 저장
         info_str = f"{info_prefix}: '{label}' (ID: {codepoint})"
@@ -1117,7 +1458,7 @@ class CoordinateComparator:
         
         return rect_id
 
-    def draw_position_rectangle(self, pos_coords, uv_coords, source_image, color, label, codepoint, info_prefix, offset_x=0, offset_y=0, style='solid', source='original'):
+    def draw_position_rectangle(self, pos_coords, uv_coords, source_image, color, label, codepoint, info_prefix, offset_x=0, offset_y=0, style='solid', source='original', tags=()):
         """Position coordinates를 기반으로 텍스처가 입혀진 사각형을 그립니다."""
         if len(pos_coords) < 4:
             self.log_message(f"[Error] {label}: less than 4 Position coordinates ({len(pos_coords)})")
@@ -1127,21 +1468,14 @@ class CoordinateComparator:
         # simple_position_viewer.py와 동일한 방식 사용
         scale = self.grid_scale  # position 스케일 (동적)
         
-        canvas_coords = []
-        for coord in pos_coords:
-            # X: position coordinates를 원점 기준으로 변환
-            canvas_x = offset_x + (coord[0] * scale)
-            
-            # Y: 반전 (canvas는 아래가 +, position은 위가 +)
-            canvas_y = offset_y - (coord[1] * scale)
-            
-            canvas_coords.extend([canvas_x, canvas_y])
-
-        # 바운딩 박스 계산
-        x_coords = canvas_coords[::2]  # 짝수 인덱스 = x coordinates
-        y_coords = canvas_coords[1::2]  # 홀수 인덱스 = y coordinates
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
+        # 바운딩 박스를 position 공간에서 구한 뒤 모서리만 변환 (변환이 단조이므로 결과 동일)
+        pos_x_min, pos_y_min, pos_x_max, pos_y_max = coord_bounds(pos_coords)
+        # X: position coordinates를 원점 기준으로 변환
+        x_min = offset_x + (pos_x_min * scale)
+        x_max = offset_x + (pos_x_max * scale)
+        # Y: 반전 (canvas는 아래가 +, position은 위가 +)
+        y_min = offset_y - (pos_y_max * scale)
+        y_max = offset_y - (pos_y_min * scale)
 
         # 시계방향 사각형 coordinates (좌상, 좌하, 우하, 우상)
         canvas_pos_coords = [
@@ -1155,9 +1489,9 @@ class CoordinateComparator:
 
         # 3. 테두리 사각형 그리기
         if style == 'dashed':
-            rect_id = self.canvas.create_polygon(canvas_pos_coords, outline=color, width=2, fill='', dash=(6, 3))
+            rect_id = self.canvas.create_polygon(canvas_pos_coords, outline=color, width=2, fill='', dash=(6, 3), tags=tags)
         else: # solid
-            rect_id = self.canvas.create_polygon(canvas_pos_coords, outline=color, width=2, fill='')
+            rect_id = self.canvas.create_polygon(canvas_pos_coords, outline=color, width=2, fill='', tags=tags)
 
         # 4. 라벨 추가
         center_x = (x_min + x_max) / 2
@@ -1165,7 +1499,7 @@ class CoordinateComparator:
         if style == 'dashed':
             center_y += 10
             
-        text_id = self.canvas.create_text(center_x, center_y, text=label, fill=color, font=('Arial', 12, 'bold'))
+        text_id = self.canvas.create_text(center_x, center_y, text=label, fill=color, font=self._pos_label_font, tags=tags)
         
         # 5. 클릭 정보를 위해 ID와 정보 저장
         info_str = f"{info_prefix}: '{label}' (ID: {codepoint})"
@@ -1174,7 +1508,25 @@ class CoordinateComparator:
         
         return rect_id
 
-    def render_glyph_image(self, pos_coords, uv_coords, texture_filename, origin_x, origin_y, source='original'):
+    def _get_atlas(self, texture_path, mtime):
+        """Atlas 이미지를 한 번만 디코드하여 보관 (파일 mtime이 바뀌면 다시 로드)"""
+        key = str(texture_path)
+        cached = self._atlas_cache.get(key)
+        if cached is None or cached[0] != mtime:
+            atlas_img = Image.open(texture_path)
+            atlas_img.load()
+            if atlas_img.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+                # 팔레트/1bit 등은 한 번만 RGBA로 변환 (crop마다 변환하거나 LANCZOS 대신 NEAREST로 축소되지 않도록)
+                atlas_img = atlas_img.convert('RGBA')
+            cached = (mtime, atlas_img)
+            self._atlas_cache[key] = cached
+            if len(self._atlas_cache) > ATLAS_CACHE_SIZE:
+                self._atlas_cache.popitem(last=False)  # 가장 오래 쓰지 않은 atlas 제거
+        else:
+            self._atlas_cache.move_to_end(key)
+        return cached[1]
+
+    def render_glyph_image(self, pos_coords, uv_coords, texture_filename, origin_x, origin_y, source='original', tags=()):
         """
         실제 글자 이미지를 Atlas에서 crop하여 Position 위치에 렌더링합니다.
         
@@ -1184,6 +1536,7 @@ class CoordinateComparator:
             texture_filename: 텍스처 파일명 (Original용) 또는 None (새 파일용)
             origin_x, origin_y: 캔버스 원점 위치
             source: 'original' 또는 'new'
+            tags: 캔버스 아이템 태그 (체크박스 토글 시 표시/숨김에 사용)
         """
         try:
             # 1. Atlas 이미지 로드
@@ -1200,36 +1553,11 @@ class CoordinateComparator:
                 self.log_message(f"[Warning] Texture file not found: {texture_path}")
                 return
             
-            atlas_img = Image.open(texture_path)
-            
-            # 2. UV coordinates로 Atlas에서 글자 영역 crop
-            us = [uv[0] for uv in uv_coords]
-            vs = [uv[1] for uv in uv_coords]
-            
-            img_width, img_height = atlas_img.size
-            
-            # DirectX 스타일: Original과 새 파일 모두 동일한 방식 사용
-            tex_left = min(us) * img_width
-            tex_right = max(us) * img_width
-            tex_top = min(vs) * img_height
-            tex_bottom = max(vs) * img_height
-            
-            # Crop 영역이 유효한지 확인
-            if tex_right <= tex_left or tex_bottom <= tex_top:
-                return
-            
-            glyph_img = atlas_img.crop((tex_left, tex_top, tex_right, tex_bottom))
-            
-            # 3. Position coordinates를 캔버스 coordinates로 변환
+            # 2. Position coordinates를 캔버스 coordinates로 변환
             scale = self.grid_scale
             
-            xs = [pos[0] for pos in pos_coords]
-            ys = [pos[1] for pos in pos_coords]
-            
-            pos_left = min(xs)
-            pos_right = max(xs)
-            pos_top = max(ys)  # Y는 위쪽이 큰 값
-            pos_bottom = min(ys)  # Y는 아래쪽이 작은 값
+            # Y는 위쪽이 큰 값 (pos_top = y 최대, pos_bottom = y 최소)
+            pos_left, pos_bottom, pos_right, pos_top = coord_bounds(pos_coords)
             
             # Canvas coordinates로 변환
             canvas_left = origin_x + (pos_left * scale)
@@ -1244,30 +1572,79 @@ class CoordinateComparator:
             if render_width <= 0 or render_height <= 0:
                 return
             
-            # 4. 이미지 리사이즈
-            resized_glyph = glyph_img.resize((render_width, render_height), Image.Resampling.LANCZOS)
+            # 3. UV 범위 (DirectX 스타일: Original과 새 파일 모두 동일한 방식 사용)
+            u_min, v_min, u_max, v_max = coord_bounds(uv_coords)
+            
+            # Crop 영역이 유효한지 확인
+            if u_max <= u_min or v_max <= v_min:
+                return
             
-            # 5. PhotoImage로 변환 (master를 명시적으로 지정하여 참조 유지)
-            tk_image = ImageTk.PhotoImage(resized_glyph, master=self.root)
+            # 4. 같은 atlas/UV/크기의 PhotoImage는 재사용 (atlas가 바뀌면 mtime으로 구분)
+            texture_mtime = texture_path.stat().st_mtime_ns
+            key = (str(texture_path), texture_mtime,
+                   u_min, v_min, u_max, v_max, render_width, render_height)
+            tk_image = self._photo_cache.get(key)
+            if tk_image is None:
+                atlas_img = self._get_atlas(texture_path, texture_mtime)
+                img_width, img_height = atlas_img.size
+                glyph_img = atlas_img.crop((u_min * img_width, v_min * img_height,
+                                            u_max * img_width, v_max * img_height))
+                if glyph_img.size == (render_width, render_height):
+                    resized_glyph = glyph_img  # 1:1이면 리샘플링 생략
+                else:
+                    # reducing_gap: 크게 축소할 때 먼저 정수배로 줄인 뒤 LANCZOS (2단계 축소)
+                    resized_glyph = glyph_img.resize((render_width, render_height), Image.Resampling.LANCZOS,
+                                                     reducing_gap=2.0)
+                # PhotoImage로 변환 (master를 명시적으로 지정하여 참조 유지)
+                tk_image = ImageTk.PhotoImage(resized_glyph, master=self.root)
+                self._photo_cache[key] = tk_image
+                if len(self._photo_cache) > PHOTO_CACHE_SIZE:
+                    self._photo_cache.popitem(last=False)  # 가장 오래 쓰지 않은 이미지 제거
+            else:
+                self._photo_cache.move_to_end(key)
+            # 캔버스에 표시 중인 이미지는 캐시에서 밀려나도 참조 유지
             self.tk_images.append(tk_image)
             
-            # 6. Canvas에 이미지 표시
+            # 5. Canvas에 이미지 표시
             # 좌상단 위치에 anchor='nw'로 배치
-            self.canvas.create_image(canvas_left, canvas_top, image=tk_image, anchor='nw')
+            self.canvas.create_image(canvas_left, canvas_top, image=tk_image, anchor='nw', tags=tags)
             
         except Exception as e:
             self.log_message(f"[Warning] Character image rendering failed: {e}")
 
     def log_message(self, message):
-        """GUI와 콘솔에 메시지 로깅"""
+        """GUI와 콘솔에 메시지 로깅 (버퍼에 쌓았다가 idle 시점에 한 번에 출력)"""
         if hasattr(self, "info_text"):
-            text = message if message.endswith("\n") else message + "\n"
-            self.info_text.insert("end", text)
-            self.info_text._textbox.see("end")
-
-    def analyze_and_log_differences(self, codepoint, original_data, new_data):
-        """coordinates 차이를 분석하고 로그에 기록합니다."""
-        char = chr(codepoint) if codepoint < 0x110000 else '?'
+            self._log_buf.append(message if message.endswith("\n") else message + "\n")
+            if not self._log_flush_pending:
+                self._log_flush_pending = True
+                self.root.after_idle(self._flush_log)
+
+    def _debug_log(self, message):
+        """verbose일 때만 log_message로 전달 (글리프 로드 경로의 상세 로그용)"""
+        if self.verbose:
+            self.log_message(message)
+
+    def _flush_log(self):
+        """버퍼의 로그를 insert 한 번(콘솔 print 한 번)으로 출력"""
+        self._log_flush_pending = False
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        self.info_text.insert("end", text)
+        textbox = self.info_text._textbox
+        excess = int(textbox.index("end-1c").split(".")[0]) - LOG_MAX_LINES
+        if excess > 0:
+            textbox.delete("1.0", f"{excess + 1}.0")
+        textbox.see("end")
+
+    def analyze_and_log_differences(self, codepoint, original_data, new_data, use_transformed=None):
+        """coordinates 차이를 분석하고 로그에 기록합니다.
+
+        use_transformed를 주지 않으면 baseline 변환 체크박스 값을 읽습니다.
+        """
+        char = codepoint_char(codepoint)
         
         # metrics 정보 로드
         original_glyph_metrics = self.load_glyph_metrics(codepoint, 'original')
@@ -1324,9 +1701,10 @@ class CoordinateComparator:
             return
         
         # 실제 Position coordinates 출력 (체크박스 상태에 따라 선택)
-        use_transformed = self.apply_baseline_transform.get()
-        original_positions = original_data['positions_transformed'] if use_transformed else original_data['positions_raw']
-        new_positions = new_data['positions_transformed'] if use_transformed else new_data['positions_raw']
+        if use_transformed is None:
+            use_transformed = self.apply_baseline_transform.get()
+        original_positions = self._positions(original_data, use_transformed)
+        new_positions = self._positions(new_data, use_transformed)
         original_uvs = original_data['uvs']
         new_uvs = new_data['uvs']
         
@@ -1338,29 +1716,20 @@ class CoordinateComparator:
             self.log_message(f"[Error] coordinates count mismatch: Original {len(original_positions)}, New {len(new_positions)}")
             return
 
-        differences = []
-        for i in range(len(original_positions)):
-            original_pos = original_positions[i]
-            new_pos = new_positions[i]
-            original_uv = original_uvs[i]
-            new_uv = new_uvs[i]
-
-            # Position 차이 계산
-            pos_diff = [abs(a - b) for a, b in zip(original_pos, new_pos)]
-            pos_diff_sum = sum(pos_diff)
-
-            # UV 차이 계산
-            uv_diff = [abs(a - b) for a, b in zip(original_uv, new_uv)]
-            uv_diff_sum = sum(uv_diff)
-
-            # 차이가 있는 경우 로그에 추가
-            if pos_diff_sum > 0.0001 or uv_diff_sum > 0.0001: # 작은 차이는 무시
-                differences.append(f"  - vertex {i}: Position diff: {pos_diff_sum:.6f}, UV diff: {uv_diff_sum:.6f}")
+        if original_positions == new_positions and original_uvs == new_uvs:
+            differences = []  # 완전히 같은 글자는 정점별 비교 생략 (튜플 비교 한 번)
+        else:
+            differences = vertex_differences(original_positions, new_positions, original_uvs, new_uvs)
 
         if differences:
             self.log_message(f"\n'{char}' coordinates difference analysis:")
-            for diff in differences:
-                self.log_message(diff)
+            # 차이가 큰 정점만 포맷 (큰 글리프에서도 로그 비용이 일정)
+            shown = heapq.nlargest(LOG_MAX_DIFF_VERTICES, differences, key=lambda d: d[1] + d[2])
+            lines = [f"  - vertex {i}: Position diff: {pos_diff_sum:.6f}, UV diff: {uv_diff_sum:.6f}"
+                     for i, pos_diff_sum, uv_diff_sum in shown]
+            if len(differences) > len(shown):
+                lines.append(f"  ... {len(differences) - len(shown)} more differing vertices")
+            self.log_message("\n".join(lines))
         else:
             self.log_message(f"\n '{char}' coordinates are identical.")
 
@@ -1371,13 +1740,13 @@ class CoordinateComparator:
         
         # 원점 십자선 (굵게)
         self.canvas.create_line(x_center - 15, y_center, x_center + 15, y_center, 
-                               fill='black', width=3)
+                               fill='black', width=3, tags='layout')
         self.canvas.create_line(x_center, y_center - 15, x_center, y_center + 15, 
-                               fill='black', width=3)
+                               fill='black', width=3, tags='layout')
         
         # 원점 레이블
         self.canvas.create_text(x_center + 30, y_center - 30, text='Origin (0, 0)', 
-                               fill='black', font=('Arial', 11, 'bold'))
+                               fill='black', font=('Arial', 11, 'bold'), tags='layout')
 
     def draw_grid(self):
         """Position 영역에 그리드 그리기"""
@@ -1390,6 +1759,14 @@ class CoordinateComparator:
         grid_range_x = int(scale * 1.5)  # ±1.5 범위 = 450px
         grid_range_y = int(scale * 1.5)  # ±1.5 범위 = 450px
         grid_step = 50  # 50픽셀 간격
+        inv_scale = 1.0 / scale  # 눈금 값 계산용 (픽셀 -> Position)
+        left, right = origin_x - grid_range_x, origin_x + grid_range_x
+        top, bottom = origin_y - grid_range_y, origin_y + grid_range_y
+        
+        # 옅은 보조선(0.5px)은 지그재그 꺾은선 하나로 그림
+        # (선 사이 연결 구간은 그리드 테두리 = 같은 보조선 위를 지나므로 모양은 동일)
+        minor_path = []
+        minor_count = 0
         
         # 세로 그리드선 (X축)
         for i in range(-grid_range_x, grid_range_x + 1, grid_step):
@@ -1397,14 +1774,19 @@ class CoordinateComparator:
             line_width = 2 if i == 0 else (1 if i % 100 == 0 else 0.5)
             line_color = '#666666' if i == 0 else ('#CCCCCC' if i % 100 == 0 else grid_color)
             
-            self.canvas.create_line(x, origin_y - grid_range_y, x, origin_y + grid_range_y,
-                                   fill=line_color, width=line_width)
+            if line_color == grid_color:
+                y_from, y_to = (top, bottom) if minor_count % 2 == 0 else (bottom, top)
+                minor_path.extend((x, y_from, x, y_to))
+                minor_count += 1
+            else:
+                self.canvas.create_line(x, top, x, bottom,
+                                       fill=line_color, width=line_width, tags='layout')
             
             # 눈금 숫자 (100px 간격마다)
             if i % 100 == 0:
-                pos_value = i / scale
+                pos_value = i * inv_scale
                 self.canvas.create_text(x, origin_y + grid_range_y + 15,
-                                       text=f"{pos_value:.2f}", fill='#999999', font=('Arial', 8))
+                                       text=f"{pos_value:.2f}", fill='#999999', font=self._grid_font, tags='layout')
         
         # 가로 그리드선 (Y축)
         for i in range(-grid_range_y, grid_range_y + 1, grid_step):
@@ -1412,24 +1794,70 @@ class CoordinateComparator:
             line_width = 2 if i == 0 else (1 if i % 100 == 0 else 0.5)
             line_color = '#666666' if i == 0 else ('#CCCCCC' if i % 100 == 0 else grid_color)
             
-            self.canvas.create_line(origin_x - grid_range_x, y, origin_x + grid_range_x, y,
-                                   fill=line_color, width=line_width)
+            if line_color == grid_color:
+                x_from, x_to = (right, left) if minor_count % 2 == 0 else (left, right)
+                minor_path.extend((x_from, y, x_to, y))
+                minor_count += 1
+            else:
+                self.canvas.create_line(left, y, right, y,
+                                       fill=line_color, width=line_width, tags='layout')
             
             # 눈금 숫자 (100px 간격마다)
             if i % 100 == 0:
-                pos_value = -i / scale
+                pos_value = -i * inv_scale
                 self.canvas.create_text(origin_x - grid_range_x - 30, y,
-                                       text=f"{pos_value:.2f}", fill='#999999', font=('Arial', 8))
+                                       text=f"{pos_value:.2f}", fill='#999999', font=self._grid_font, tags='layout')
+        
+        if minor_path:
+            self.canvas.create_line(minor_path, fill=grid_color, width=0.5, tags='layout')
         
         # 축 레이블
         self.canvas.create_text(origin_x + grid_range_x - 30, origin_y + 25,
-                               text='X →', fill='#666666', font=('Arial', 10, 'bold'))
+                               text='X →', fill='#666666', font=self._axis_font, tags='layout')
         self.canvas.create_text(origin_x + 25, origin_y - grid_range_y + 30,
-                               text='↑ Y', fill='#666666', font=('Arial', 10, 'bold'))
+                               text='↑ Y', fill='#666666', font=self._axis_font, tags='layout')
+
+    def _index_ready(self, action):
+        """True when the background indexing is done; otherwise action is re-run once it is
+
+        Clicking again while waiting keeps a single pending call per action (it reads the
+        inputs when it finally runs). The worker's parse warnings are logged on the first
+        call after it finishes.
+        """
+        if not self._index_future.done():
+            if action not in self._deferred:
+                self.log_message(" Waiting for XML libraries to finish loading...")
+                self._deferred[action] = self.root.after(INDEX_POLL_MS, self._poll_deferred, action)
+            return False
+        pending = self._deferred.pop(action, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        if not self._index_warnings_logged:
+            self._index_warnings_logged = True
+            for warning in self._index_future.result():
+                self.log_message(warning)
+        return True
+
+    def _poll_deferred(self, action):
+        """Deferred button action; keeps polling quietly until the indexing is done"""
+        if not self._index_future.done():
+            self._deferred[action] = self.root.after(INDEX_POLL_MS, self._poll_deferred, action)
+            return
+        del self._deferred[action]
+        action()
+
+    def check_file_paths_clicked(self):
+        """'Check File Paths' button: runs check_file_paths once the background indexing is done"""
+        if self._index_ready(self.check_file_paths_clicked):
+            self.check_file_paths()
 
     def compare_coordinates(self):
         """coordinates 비교 실행"""
-        self.clear_canvas()
+        # 백그라운드 색인이 끝나지 않았으면 UI를 막지 않고 끝난 뒤 다시 실행
+        if not self._index_ready(self.compare_coordinates):
+            return
+
+        self.clear_glyph_items()
         
         char_input = self.char_entry.get().strip()
         if not char_input:
@@ -1441,20 +1869,7 @@ class CoordinateComparator:
         self.last_char_input = char_input
 
         try:
-            # 쉼표로 구분된 ID 또는 문자열 입력 처리
-            if ',' in char_input:
-                codepoints = []
-                parts = [p.strip() for p in char_input.split(',')]
-                for part in parts:
-                    if not part: continue
-                    # 단일 문자인지, 숫자인지 확인
-                    if len(part) == 1 and not part.isdigit():
-                        codepoints.append(ord(part))
-                    else:
-                        codepoints.append(int(part))
-            # 단일 문자 또는 문자열
-            else:
-                codepoints = [ord(c) for c in char_input]
+            codepoints = parse_codepoints(char_input)
         except (ValueError, TypeError) as e:
             self.log_message(f"[Error] Invalid input: '{char_input}'. Error: {e}")
             messagebox.showerror("Input Error", f"Invalid input: '{char_input}'.\nEnter a character, Unicode ID, or comma-separated list.")
@@ -1462,10 +1877,11 @@ class CoordinateComparator:
 
         self.root.title(f"'{char_input}' coordinates comparison")
         self.log_message(f"'{char_input}' Starting coordinate comparison...\n")
-        self.root.update()
+        # 제목/로그만 먼저 그림 (update()와 달리 사용자 이벤트를 처리하지 않아 재진입 없음)
+        self.root.update_idletasks()
 
-        # Canvas 지우고 레이아웃 그리기
-        self.clear_canvas()
+        # 이전 글자 지우고 레이아웃 그리기 (크기가 같으면 기존 레이아웃 재사용)
+        self.clear_glyph_items()
         self.draw_canvas_layout()
 
         colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'cyan']
@@ -1473,9 +1889,14 @@ class CoordinateComparator:
         # 데이터 로드 및 캐싱 (raw/transformed 둘 다 저장)
         self.loaded_data.clear()
         
-        for i, codepoint in enumerate(codepoints):
+        # 체크박스 값은 비교 한 번에 한 번만 읽음 (BooleanVar.get()은 Tcl 호출)
+        use_transformed = self.apply_baseline_transform.get()
+        
+        # 표시용 문자는 루프 밖에서 한 번에 계산
+        chars = list(map(codepoint_char, codepoints))
+
+        for i, (codepoint, char) in enumerate(zip(codepoints, chars)):
             color = colors[i % len(colors)]
-            char = chr(codepoint) if codepoint < 0x110000 else '?'
 
             self.log_message(f"\n--- '{char}' (ID: {codepoint}) Processing started (Color: {color}) ---")
 
@@ -1496,69 +1917,14 @@ class CoordinateComparator:
             self.loaded_data[codepoint] = {
                 'original': original_data,
                 'new': new_data,
-                'color': color
+                'color': color,
+                'char': char
             }
 
-            # UV 비교: 동적 크기 UV 박스 영역
-            # Position coordinates 원점 (캔버스 중앙)
-            pos_origin_x = self.canvas_width // 2
-            pos_origin_y = self.canvas_height // 2
-            
-            uv_offset_x = pos_origin_x - self.uv_box_width + 10  # UV 박스 좌상단 + 여백
-            uv_offset_y = pos_origin_y - self.uv_box_height + 30
-            
-            # UV scale: atlas 비율에 맞춤 (작은 쪽 기준)
-            uv_scale = min(self.uv_box_width, self.uv_box_height) - 20  # 여백
-            
-            # 체크박스 상태에 따라 UV coordinates 그리기
-            if self.show_original.get() and original_data:
-                self.draw_rectangle(original_data['uvs'], color, f"{char}", codepoint, "Original", 
-                                  uv_offset_x, uv_offset_y, style='solid', scale=uv_scale)
-            if self.show_new.get() and new_data:
-                self.draw_rectangle(new_data['uvs'], color, f"{char}", codepoint, "New", 
-                                  uv_offset_x, uv_offset_y, style='dashed', scale=uv_scale)
-            
-            # Position Y 변환 체크박스 상태에 따라 coordinates 선택
-            use_transformed = self.apply_baseline_transform.get()
-            
-            # 체크박스 상태에 따라 Position coordinates 그리기
-            if self.show_original.get() and original_data:
-                positions = original_data['positions_transformed'] if use_transformed else original_data['positions_raw']
-                self.draw_position_rectangle(positions, original_data['uvs'], None, 
-                                            color, f"{char}", codepoint, "Original", 
-                                            pos_origin_x, pos_origin_y, style='solid', 
-                                            source=original_data.get('source', 'original'))
-            if self.show_new.get() and new_data:
-                positions = new_data['positions_transformed'] if use_transformed else new_data['positions_raw']
-                self.draw_position_rectangle(positions, new_data['uvs'], None, 
-                                            color, f"{char}", codepoint, "New", 
-                                            pos_origin_x, pos_origin_y, style='dashed', 
-                                            source=new_data.get('source', 'generated_library'))
-            
-            # 체크박스 상태에 따라 글자 이미지 렌더링
-            if self.show_glyph_image.get():
-                if self.show_original.get() and original_data:
-                    positions = original_data['positions_transformed'] if use_transformed else original_data['positions_raw']
-                    self.render_glyph_image(
-                        positions,
-                        original_data['uvs'],
-                        original_data.get('texture'),
-                        pos_origin_x,
-                        pos_origin_y,
-                        source='original'
-                    )
-                if self.show_new.get() and new_data:
-                    positions = new_data['positions_transformed'] if use_transformed else new_data['positions_raw']
-                    self.render_glyph_image(
-                        positions,
-                        new_data['uvs'],
-                        new_data.get('texture'),
-                        pos_origin_x,
-                        pos_origin_y,
-                        source='new'
-                    )
-
-            self.analyze_and_log_differences(codepoint, original_data, new_data)
+            self.analyze_and_log_differences(codepoint, original_data, new_data, use_transformed)
+
+        # 로드한 데이터를 한 번에 그리기 (체크박스 토글 시에도 같은 경로 사용)
+        self.render_loaded_data()
 
         self.log_message("\n All characters processed successfully.")
 
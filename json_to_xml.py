@@ -7,14 +7,95 @@ Usage:
 
 import json
 import struct
+import array
+import sys
 import os
 import argparse
-import xml.etree.ElementTree as ET
+import contextlib
+from xml.sax.saxutils import escape
+
+try:
+    import orjson   # optional, faster atlas JSON parsing
+except ImportError:
+    orjson = None
+
+# ET.tostring과 같은 규칙으로 속성값 이스케이프 (따옴표, 줄바꿈/탭 포함)
+_ATTR_ENTITIES = {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#09;'}
+
+# Big-endian UV(float2) 패킹 (포맷은 모듈 로드 시 한 번만 컴파일)
+_PACK_UV = struct.Struct('>ff').pack
+
+# 단위 행렬 TRANSFORM (ROOTNODE와 모든 RENDERNODE가 공유)
+_IDENTITY_TRANSFORM = (
+    '\n<TRANSFORM>'
+    '\n1.000000000e+000 0.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 '
+    '\n-0.000000000e+000 -0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 -0.000000000e+000 1.000000000e+000 </TRANSFORM>'
+)
+
+# 글리프마다 같은 XML 조각 (모든 DATABLOCK/SEGMENTSET/RENDERNODE에 그대로 붙임)
+# DATABLOCKSTREAM: position(float3) offset 0 + UV(float2) offset 12, stride 20
+_DATABLOCK_STREAMS = (
+    '\n<DATABLOCKSTREAM renderType="Vertex" dataType="float3" offset="0" stride="20" />'
+    '\n<DATABLOCKSTREAM renderType="ST" dataType="float2" offset="12" stride="20" />'
+)
+# INDEXSOURCEDATA - 사각형을 2개의 삼각형으로
+_QUAD_INDEX_DATA = '\n<INDEXSOURCEDATA>\n0 1 2 0 2 3 </INDEXSOURCEDATA>'
+# planeBounds 없는 글리프의 크기 0 BOUNDINGBOX (원본과 동일)
+_ZERO_BOUNDINGBOX = '\n<BOUNDINGBOX>\n0.000000000e+000 0.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 -0.000000000e+000 </BOUNDINGBOX>'
+# ROOTNODE 머리 (모든 RENDERNODE의 부모): 단위 행렬 TRANSFORM, 0으로 초기화한 BOUNDINGBOX
+_ROOTNODE_HEAD = (
+    '\n<ROOTNODE stopTraversal="0" nickname="Root" id="Root">'
+    + _IDENTITY_TRANSFORM +
+    '\n<BOUNDINGBOX>\n0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 </BOUNDINGBOX>'
+)
+
+
+def _attr(value):
+    """XML 속성값으로 쓸 문자열 이스케이프"""
+    return escape(str(value), _ATTR_ENTITIES)
+
+
+WRITE_BUFFER_SIZE = 1 << 20   # LIBRARY 파일 쓰기 버퍼 (조각을 글리프마다 바로 씀)
+PROGRESS_MASK = 1024 - 1       # 글리프 1024개마다 진행 상황 출력 (i & PROGRESS_MASK == 0)
+
+
+class _LibraryWriter:
+    """LIBRARY XML 파일 하나에 요소 조각을 바로 이어 쓰는 writer (PSSG 머리/꼬리 포함)
+
+    조각은 '\n<ELEMENT ...>' 형태로, 요소마다 줄바꿈하고 들여쓰기는 없습니다.
+    자식이 하나도 없으면 <LIBRARY type="..." />로 닫습니다.
+    """
+
+    def __init__(self, filepath, library_type):
+        self.filepath = filepath
+        self._file = open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+        self._file.write(f'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<PSSGFILE version="1.0.0.0"><PSSGDATABASE><LIBRARY type="{library_type}"')
+        self._empty = True
+
+    def write(self, fragment):
+        if self._empty:
+            self._file.write('>')
+            self._empty = False
+        self._file.write(fragment)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # 예외로 중단되면 닫는 태그 없이 파일만 닫음
+        if exc_type is None:
+            self._file.write(' />' if self._empty else '\n</LIBRARY>')
+            self._file.write('</PSSGDATABASE></PSSGFILE>')
+        self._file.close()
+        if exc_type is None:
+            print(f"저장: {self.filepath}")
+        return False
+
 
 class XMLGenerator:
     def __init__(self, json_path, texture_name, font_name, h_scale=1.0,
                  h_scale_chars=None, spacing_chars=None, spacing_ratio=1.0,
-                 spacing_symmetric=False, uv_inset=0.0):
+                 spacing_symmetric=False, uv_inset=0.0, data=None, share_geometry=False):
         """
         Args:
             json_path: msdf-atlas-gen이 생성한 JSON 파일 경로
@@ -26,6 +107,9 @@ class XMLGenerator:
             spacing_ratio: advanceWidth 비율 (1.0=원본, 0.6=40% 감소)
             spacing_symmetric: True이면 줄어든 여백을 좌우 균등 분배, False이면 오른쪽만
             uv_inset: UV 좌표를 atlas 경계에서 안쪽으로 당기는 픽셀 수 (0.5 권장)
+            data: 이미 파싱된 JSON dict (주어지면 json_path를 다시 읽지 않음)
+            share_geometry: True이면 버텍스 데이터가 같은 글리프(크기 0 글리프 등)가 DATABLOCK/SEGMENTSET을
+                            공유 (RENDERNODE만 따로 생성). 원본 라이브러리는 글리프마다 따로 두므로 기본값 False
         """
         self.json_path = json_path
         self.texture_name = texture_name
@@ -36,10 +120,14 @@ class XMLGenerator:
         self.spacing_ratio = max(0.1, min(2.0, float(spacing_ratio)))
         self.spacing_symmetric = bool(spacing_symmetric)
         self.uv_inset = max(0.0, float(uv_inset))
+        self.share_geometry = bool(share_geometry)
         
-        print(f"JSON 파일 로딩: {json_path}")
-        with open(json_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        if data is None:
+            print(f"JSON 파일 로딩: {json_path}")
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        self.data = data
         
         self.atlas_width = self.data['atlas']['width']
         self.atlas_height = self.data['atlas']['height']
@@ -53,384 +141,308 @@ class XMLGenerator:
         
         print(f"아틀라스 크기: {self.atlas_width}x{self.atlas_height}")
         print(f"글리프 개수: {len(self.glyphs)}")
-        
-        # ID 생성용 카운터
-        self.datablock_counter = 0
-        self.segment_counter = 0
     
-    def _get_h_scale(self, unicode_val):
-        """글자별 유효 h_scale 반환 (h_scale_chars에 없으면 1.0)"""
-        if self.h_scale_chars is None or unicode_val in self.h_scale_chars:
-            return self.h_scale
-        return 1.0
-
-    def _get_spacing_offset(self, glyph):
-        """균등 트리밍 시 글자를 왼쪽으로 이동할 em 단위 offset 반환.
-        symmetric=False이면 0 반환 (오른쪽만 자름).
-        offset = advance * hs * (1 - sr) / 2
+    def _glyph_records(self):
+        """글리프별 (unicode, advance, plane, atlas) 튜플 리스트 (self.glyphs 순서)
+
+        JSON 글리프 dict에서 필요한 값만 한 번에 꺼내 둡니다 (이후 단계는 dict 조회 없이 튜플만 사용).
+        advance: 없으면 None (쓰는 곳마다 기본값이 다름)
+        plane, atlas: planeBounds/atlasBounds의 (left, bottom, right, top), 없으면 None
         """
-        if not self.spacing_symmetric:
-            return 0.0
-        unicode_val = glyph['unicode']
-        sr = self.spacing_ratio if (
-            self.spacing_chars is None or unicode_val in self.spacing_chars
-        ) else 1.0
-        if sr >= 1.0:
-            return 0.0
-        hs = self._get_h_scale(unicode_val)
-        advance = glyph.get('advance', 0.0)
-        return advance * hs * (1.0 - sr) / 2.0
-
-    def _generate_id(self, prefix=""):
-        """고유 ID 생성"""
-        # PSSG 스타일 ID 생성 (예: !xC, !yC, !zC ...)
-        # 간단하게 순차 번호로 생성
-        counter = self.datablock_counter if prefix == "DB" else self.segment_counter
-        if prefix == "DB":
-            self.datablock_counter += 1
-        else:
-            self.segment_counter += 1
-        return f"!GEN{prefix}{counter:04X}"
+        records = []
+        for glyph in self.glyphs:
+            pb = glyph.get('planeBounds')
+            ab = glyph.get('atlasBounds')
+            records.append((
+                glyph['unicode'],
+                glyph.get('advance'),
+                None if pb is None else (pb['left'], pb['bottom'], pb['right'], pb['top']),
+                None if ab is None else (ab['left'], ab['bottom'], ab['right'], ab['top']),
+            ))
+        return records
+
+    def _glyph_scales(self, records):
+        """글리프별 (hs, sr, sp_offset) 리스트 (records: _glyph_records()의 결과)
+
+        글리프 루프 전에 한 번에 계산해 DATABLOCK, RENDERNODE, NEGLYPHMETRICS와
+        최대 advance 계산이 공유합니다.
+        hs: 글자별 유효 h_scale (h_scale_chars에 없으면 1.0)
+        sr: 글자별 유효 spacing_ratio (spacing_chars에 없으면 1.0)
+        sp_offset: 균등 트리밍 시 글자를 왼쪽으로 이동할 em 단위 offset
+                   = advance * hs * (1 - sr) / 2  (symmetric=False이면 0, 오른쪽만 자름)
+        """
+        h_scale, h_scale_chars = self.h_scale, self.h_scale_chars
+        spacing_ratio, spacing_chars = self.spacing_ratio, self.spacing_chars
+        symmetric = self.spacing_symmetric
+        
+        scales = []
+        for unicode_val, advance, _, _ in records:
+            hs = h_scale if h_scale_chars is None or unicode_val in h_scale_chars else 1.0
+            sr = spacing_ratio if spacing_chars is None or unicode_val in spacing_chars else 1.0
+            if symmetric and sr < 1.0:
+                sp_offset = (0.0 if advance is None else advance) * hs * (1.0 - sr) / 2.0
+            else:
+                sp_offset = 0.0
+            scales.append((hs, sr, sp_offset))
+        return scales
+
+    def _glyph_ids(self, index):
+        """index번째 글리프의 (datablock_id, segment_id, datasource_id, indexsource_id)
+
+        PSSG 스타일 순차 ID: DATABLOCK은 글리프 번호, SEGMENTSET/RENDERDATASOURCE/RENDERINDEXSOURCE는
+        하나의 번호열을 글리프마다 3개씩 나눠 씀 (예: !GENDB0001, !GENSEG0003, !GENDS0004, !GENIS0005)
+        """
+        n = index * 3
+        return f"!GENDB{index:04X}", f"!GENSEG{n:04X}", f"!GENDS{n + 1:04X}", f"!GENIS{n + 2:04X}"
     
     def _uv_to_big_endian_hex(self, u, v):
         """UV 좌표를 Big-endian float hex 문자열로 변환"""
-        # Big-endian으로 float 2개를 8바이트 hex로 변환
-        byte_data = struct.pack('>ff', u, v)
-        hex_str = byte_data.hex().upper()
-        # 2자리씩 공백으로 구분
-        return ' '.join([hex_str[i:i+2] for i in range(0, len(hex_str), 2)])
+        # Big-endian으로 float 2개를 8바이트 hex로 변환 (바이트마다 공백 구분, C 수준에서 한 번에)
+        return _PACK_UV(u, v).hex(' ').upper()
     
-    def _create_vertex_datablock(self, glyph, datablock_id):
-        """글리프에 대한 버텍스 DATABLOCK 생성 (planeBounds 없으면 크기 0)"""
-        
-        # planeBounds가 없으면 모든 좌표를 0으로 설정
-        if 'planeBounds' not in glyph or 'atlasBounds' not in glyph:
-            p_left = p_right = p_top = p_bottom = 0.0
-            left = right = top = bottom = 0.0
-        else:
-            # 픽셀 좌표를 UV 좌표로 변환
-            plane_bounds = glyph['planeBounds']
-            atlas_bounds = glyph['atlasBounds']
+    def _vertex_bounds(self, records, scales):
+        """글리프별 (p_left, p_right, p_top, p_bottom, left, right, top, bottom) 리스트 (self.glyphs 순서)
+
+        records, scales: _glyph_records(), _glyph_scales()의 결과
+
+        position/UV 경계 계산을 글리프 루프 전에 한 번에 처리합니다 (planeBounds 없으면 모두 0).
+        """
+        # 루프 안에서 반복 조회하지 않도록 지역 변수로
+        ins = self.uv_inset
+        # 나눗셈 대신 역수 곱셈 (float32로 기록되므로 결과 바이트는 같음)
+        inv_width = 1.0 / self.atlas_width
+        inv_height = 1.0 / self.atlas_height
+        zero = (0.0,) * 8
+        
+        bounds = []
+        for (_, _, plane, atlas), (hs, _, sp_offset) in zip(records, scales):
+            if plane is None or atlas is None:
+                bounds.append(zero)
+                continue
+            pb_left, pb_bottom, pb_right, pb_top = plane
+            ab_left, ab_bottom, ab_right, ab_top = atlas
             
             # 아틀라스 좌표를 UV 좌표로 변환 (0.0 ~ 1.0)
             # DirectX 스타일: V=0이 이미지 상단, V=1이 이미지 하단
             # -yorigin bottom이므로 V 좌표 반전 필요
             # uv_inset: 인접 글리프 bleeding 방지를 위해 경계에서 안쪽으로 당김
-            ins = self.uv_inset
-            left   = (atlas_bounds['left']   + ins) / self.atlas_width
-            right  = (atlas_bounds['right']  - ins) / self.atlas_width
-            top    = 1.0 - ((atlas_bounds['bottom'] + ins) / self.atlas_height)
-            bottom = 1.0 - ((atlas_bounds['top']    - ins) / self.atlas_height)
+            left   = (ab_left   + ins) * inv_width
+            right  = (ab_right  - ins) * inv_width
+            top    = 1.0 - ((ab_bottom + ins) * inv_height)
+            bottom = 1.0 - ((ab_top    - ins) * inv_height)
             
             # planeBounds를 원본 게임 방식으로 변환 (글자 상단=Y0)
             # planeBounds는 베이스라인 기준이므로, top만큼 아래로 이동
             # planeBounds['top'] = 베이스라인에서 상단까지의 거리 (= verticalBearing)
-            vertical_bearing = plane_bounds['top']
-            hs = self._get_h_scale(glyph['unicode'])
-            sp_offset = self._get_spacing_offset(glyph)
-
-            p_left = plane_bounds['left'] * hs - sp_offset
-            p_right = plane_bounds['right'] * hs - sp_offset
-            p_top = plane_bounds['top'] - vertical_bearing  # = 0
-            p_bottom = plane_bounds['bottom'] - vertical_bearing
+            vertical_bearing = pb_top
             
-        
-        # 4개의 버텍스 (사각형)
-        # Vertex 데이터: position(float3) + UV(float2)
-        # stride=20, position offset=0, UV offset=12
-        
-        vertices = [
-            # (position_x, position_y, position_z, uv_u, uv_v)
+            bounds.append((
+                pb_left * hs - sp_offset,
+                pb_right * hs - sp_offset,
+                pb_top - vertical_bearing,  # = 0
+                pb_bottom - vertical_bearing,
+                left, right, top, bottom,
+            ))
+        return bounds
+    
+    def _vertex_data_hex(self, vertex_bounds):
+        """_vertex_bounds() 전체를 한 번에 Big-endian으로 패킹해 글리프별 DATABLOCKDATA hex 텍스트 리스트로 반환
+
+        글리프마다 4개의 버텍스 (사각형), Vertex 데이터: position(float3) + UV(float2)
+        stride=20, position offset=0, UV offset=12 -> 글리프당 80 bytes (한 줄에 16바이트씩 5줄)
+        """
+        values = []
+        for p_left, p_right, p_top, p_bottom, left, right, top, bottom in vertex_bounds:
+            # (position_x, position_y, position_z, uv_u, uv_v) x 4
             # DirectX 스타일: top < bottom (V가 위에서 아래로 증가)
-            (p_left, p_top, 0.0, left, top),      # 좌상 -> top (작은 V)
-            (p_left, p_bottom, 0.0, left, bottom), # 좌하 -> bottom (큰 V)
-            (p_right, p_bottom, 0.0, right, bottom), # 우하 -> bottom (큰 V)
-            (p_right, p_top, 0.0, right, top),     # 우상 -> top (작은 V)
-        ]
-        
-        # 버텍스 데이터를 Big-endian으로 인코딩
-        hex_lines = []
-        current_line = []
-        
-        for i, (px, py, pz, u, v) in enumerate(vertices):
-            # position (float3) + UV (float2) = 20 bytes
-            vertex_bytes = struct.pack('>fffff', px, py, pz, u, v)
-            vertex_hex = vertex_bytes.hex().upper()
-            
-            # 2자리씩 공백으로 구분하여 추가
-            hex_bytes = [vertex_hex[j:j+2] for j in range(0, len(vertex_hex), 2)]
-            current_line.extend(hex_bytes)
-            
-            # 한 줄에 적당한 길이만 (16바이트 = 32자 = 16개의 hex 바이트)
-            if len(current_line) >= 16:
-                hex_lines.append(' '.join(current_line[:16]))
-                current_line = current_line[16:]
-        
-        # 남은 데이터 추가
-        if current_line:
-            hex_lines.append(' '.join(current_line))
-        
-        # DATABLOCK XML 생성
-        datablock = ET.Element('DATABLOCK')
-        datablock.set('streamCount', '2')
-        datablock.set('size', '80')  # 4 vertices * 20 bytes
-        datablock.set('elementCount', '4')
-        datablock.set('id', datablock_id)
-        
-        # DATABLOCKSTREAM for Vertex (position)
-        stream_vertex = ET.SubElement(datablock, 'DATABLOCKSTREAM')
-        stream_vertex.set('renderType', 'Vertex')
-        stream_vertex.set('dataType', 'float3')
-        stream_vertex.set('offset', '0')
-        stream_vertex.set('stride', '20')
-        
-        # DATABLOCKSTREAM for ST (UV)
-        stream_st = ET.SubElement(datablock, 'DATABLOCKSTREAM')
-        stream_st.set('renderType', 'ST')
-        stream_st.set('dataType', 'float2')
-        stream_st.set('offset', '12')
-        stream_st.set('stride', '20')
-        
-        # DATABLOCKDATA
-        data_elem = ET.SubElement(datablock, 'DATABLOCKDATA')
-        data_elem.text = '\n' + '\n'.join(hex_lines) + ' '
-        
-        return datablock
+            values += (
+                p_left, p_top, 0.0, left, top,          # 좌상 -> top (작은 V)
+                p_left, p_bottom, 0.0, left, bottom,    # 좌하 -> bottom (큰 V)
+                p_right, p_bottom, 0.0, right, bottom,  # 우하 -> bottom (큰 V)
+                p_right, p_top, 0.0, right, top,        # 우상 -> top (작은 V)
+            )
+        
+        # 전체를 float32 배열로 한 번에 변환, big-endian으로 바이트 순서만 뒤집은 뒤 hex 변환
+        # ("XX XX ..."; 16바이트 한 줄 = 47자 + 구분 공백)
+        floats = array.array('f', values)
+        if sys.byteorder == 'little':
+            floats.byteswap()
+        hex_all = floats.tobytes().hex(' ').upper()
+        lines = [hex_all[i:i + 47] for i in range(0, len(hex_all), 48)]
+        return ['\n'.join(lines[i:i + 5]) for i in range(0, len(lines), 5)]
     
-    def _create_segmentset(self, glyph, datablock_id, segment_id, datasource_id, indexsource_id):
-        """SEGMENTSET 생성"""
-        segmentset = ET.Element('SEGMENTSET')
-        segmentset.set('segmentCount', '1')
-        segmentset.set('id', segment_id)
-        
-        # RENDERDATASOURCE
-        datasource = ET.SubElement(segmentset, 'RENDERDATASOURCE')
-        datasource.set('streamCount', '2')
-        datasource.set('primitive', 'triangles')
-        datasource.set('id', datasource_id)
-        
-        # RENDERINDEXSOURCE
-        indexsource = ET.SubElement(datasource, 'RENDERINDEXSOURCE')
-        indexsource.set('primitive', 'triangles')
-        indexsource.set('maximumIndex', '3')
-        indexsource.set('format', 'ushort')
-        indexsource.set('count', '6')
-        indexsource.set('id', indexsource_id)
-        
-        # INDEXSOURCEDATA - 사각형을 2개의 삼각형으로
-        indexdata = ET.SubElement(indexsource, 'INDEXSOURCEDATA')
-        indexdata.text = '\n0 1 2 0 2 3 '
-        
-        # RENDERSTREAM (2개: Vertex와 ST용)
-        stream0 = ET.SubElement(datasource, 'RENDERSTREAM')
-        stream0.set('dataBlock', f'#{datablock_id}')
-        stream0.set('subStream', '0')
-        stream0.set('id', f'{datasource_id}_0')
-        
-        stream1 = ET.SubElement(datasource, 'RENDERSTREAM')
-        stream1.set('dataBlock', f'#{datablock_id}')
-        stream1.set('subStream', '1')
-        stream1.set('id', f'{datasource_id}_1')
-        
-        return segmentset
+    def _create_vertex_datablock(self, vertex_hex, datablock_id):
+        """버텍스 DATABLOCK XML 조각 생성 (vertex_hex: _vertex_data_hex()의 한 항목)
+
+        ID는 _glyph_ids()가 만든 값이라 이스케이프하지 않습니다 (SEGMENTSET/RENDERNODE도 동일).
+        """
+        return (f'\n<DATABLOCK streamCount="2" size="80" elementCount="4" id="{datablock_id}">'
+                f'{_DATABLOCK_STREAMS}'
+                f'\n<DATABLOCKDATA>\n{vertex_hex} </DATABLOCKDATA>'
+                '\n</DATABLOCK>')
     
-    def _create_rendernode(self, glyph, datasource_id, shader_id):
-        """RENDERNODE 생성 (planeBounds 없으면 BOUNDINGBOX를 0으로)"""
-        unicode = glyph['unicode']
-        
-        rendernode = ET.Element('RENDERNODE')
-        rendernode.set('stopTraversal', '0')
-        rendernode.set('nickname', str(unicode))
-        rendernode.set('id', str(unicode))
-        
-        # TRANSFORM (단위 행렬)
-        transform = ET.SubElement(rendernode, 'TRANSFORM')
-        transform.text = '\n1.000000000e+000 0.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 \n-0.000000000e+000 -0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 -0.000000000e+000 1.000000000e+000 '
+    def _create_segmentset(self, record, datablock_id, segment_id, datasource_id, indexsource_id):
+        """SEGMENTSET XML 조각 생성 (인덱스: 사각형을 2개의 삼각형으로, RENDERSTREAM은 Vertex/ST 2개)"""
+        return (f'\n<SEGMENTSET segmentCount="1" id="{segment_id}">'
+                f'\n<RENDERDATASOURCE streamCount="2" primitive="triangles" id="{datasource_id}">'
+                f'\n<RENDERINDEXSOURCE primitive="triangles" maximumIndex="3" format="ushort" count="6" id="{indexsource_id}">'
+                f'{_QUAD_INDEX_DATA}'
+                '\n</RENDERINDEXSOURCE>'
+                f'\n<RENDERSTREAM dataBlock="#{datablock_id}" subStream="0" id="{datasource_id}_0" />'
+                f'\n<RENDERSTREAM dataBlock="#{datablock_id}" subStream="1" id="{datasource_id}_1" />'
+                '\n</RENDERDATASOURCE>'
+                '\n</SEGMENTSET>')
+    
+    def _create_rendernode(self, record, datasource_id, shader_ref, hs, sp_offset):
+        """RENDERNODE XML 조각 생성 (planeBounds 없으면 BOUNDINGBOX를 0으로)
+
+        record: _glyph_records()의 한 항목
+        shader_ref: 이스케이프된 셰이더 참조 속성값 ('#' + shader_id), 모든 글리프가 공유
+        hs, sp_offset: _glyph_scales()의 이 글리프 값
+        """
+        unicode, _, plane, _ = record
         
         # BOUNDINGBOX (planeBounds 없으면 모두 0)
-        bbox = ET.SubElement(rendernode, 'BOUNDINGBOX')
-        if 'planeBounds' in glyph:
-            pb = glyph['planeBounds']
-            hs = self._get_h_scale(unicode)
-            sp_offset = self._get_spacing_offset(glyph)
-            bbox.text = f'\n{pb["left"] * hs - sp_offset:.9e} {pb["bottom"]:.9e} -0.000000000e+000 {pb["right"] * hs - sp_offset:.9e} {pb["top"]:.9e} -0.000000000e+000 '
+        if plane is not None:
+            pb_left, pb_bottom, pb_right, pb_top = plane
+            bbox = f'\n<BOUNDINGBOX>\n{pb_left * hs - sp_offset:.9e} {pb_bottom:.9e} -0.000000000e+000 {pb_right * hs - sp_offset:.9e} {pb_top:.9e} -0.000000000e+000 </BOUNDINGBOX>'
         else:
             # 원본과 동일하게 크기 0으로 설정
-            bbox.text = '\n0.000000000e+000 0.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 -0.000000000e+000 '
-        
-        # RENDERSTREAMINSTANCE
-        stream_instance = ET.SubElement(rendernode, 'RENDERSTREAMINSTANCE')
-        stream_instance.set('sourceCount', '1')
-        stream_instance.set('indices', f'#{datasource_id}')
-        stream_instance.set('streamCount', '0')
-        stream_instance.set('shader', f'#{shader_id}')
-        stream_instance.set('id', f'{unicode}_SI')
-        
-        # RENDERINSTANCESOURCE
-        instance_source = ET.SubElement(stream_instance, 'RENDERINSTANCESOURCE')
-        instance_source.set('source', f'#{datasource_id}')
-        
-        return rendernode
+            bbox = _ZERO_BOUNDINGBOX
+        
+        return (f'\n<RENDERNODE stopTraversal="0" nickname="{unicode}" id="{unicode}">'
+                f'{_IDENTITY_TRANSFORM}{bbox}'
+                f'\n<RENDERSTREAMINSTANCE sourceCount="1" indices="#{datasource_id}" streamCount="0" '
+                f'shader="{shader_ref}" id="{unicode}_SI">'
+                f'\n<RENDERINSTANCESOURCE source="#{datasource_id}" />'
+                '\n</RENDERSTREAMINSTANCE>'
+                '\n</RENDERNODE>')
     
     def generate_libraries(self, output_dir):
-        """모든 LIBRARY XML 파일 생성"""
+        """모든 LIBRARY XML 파일 생성
+
+        요소 트리를 만들지 않고 XML 조각을 글리프마다 해당 라이브러리 파일에 바로 씁니다.
+        """
         os.makedirs(output_dir, exist_ok=True)
         
         print(f"\n출력 디렉토리: {output_dir}")
         print("="*60)
         
-        # 각 라이브러리 루트 생성
-        lib_renderinterfacebound = ET.Element('LIBRARY')
-        lib_renderinterfacebound.set('type', 'RENDERINTERFACEBOUND')
-        lib_segmentset = ET.Element('LIBRARY')
-        lib_segmentset.set('type', 'SEGMENTSET')
-        lib_node = ET.Element('LIBRARY')
-        lib_node.set('type', 'NODE')
-        lib_shaderinstance = ET.Element('LIBRARY')
-        lib_shaderinstance.set('type', 'SHADERINSTANCE')
-        lib_shadergroup = ET.Element('LIBRARY')
-        lib_shadergroup.set('type', 'SHADERGROUP')
-        lib_neglyphmetrics = ET.Element('LIBRARY')
-        lib_neglyphmetrics.set('type', 'NEGLYPHMETRICS')
-        lib_nefontmetrics = ET.Element('LIBRARY')
-        lib_nefontmetrics.set('type', 'NEFONTMETRICS')
-        
-        # ShaderGroup 생성
-        shadergroup = self._create_shadergroup()
-        lib_shadergroup.append(shadergroup)
-        
-        # Shader 생성 (모든 글리프가 공유)
-        shader_id = self.font_name
-        shader = self._create_shader(shader_id, self.texture_name)
-        lib_shaderinstance.append(shader)
-        
-        # ROOTNODE 생성 (모든 RENDERNODE의 부모)
-        rootnode = ET.Element('ROOTNODE')
-        rootnode.set('stopTraversal', '0')
-        rootnode.set('nickname', 'Root')
-        rootnode.set('id', 'Root')
-        
-        # ROOTNODE의 TRANSFORM (단위 행렬)
-        root_transform = ET.SubElement(rootnode, 'TRANSFORM')
-        root_transform.text = '\n1.000000000e+000 0.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 \n-0.000000000e+000 -0.000000000e+000 1.000000000e+000 -0.000000000e+000 0.000000000e+000 0.000000000e+000 -0.000000000e+000 1.000000000e+000 '
-        
-        # ROOTNODE의 BOUNDINGBOX (0으로 초기화)
-        root_bbox = ET.SubElement(rootnode, 'BOUNDINGBOX')
-        root_bbox.text = '\n0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 '
-        
-        # 각 글리프에 대해 데이터 생성
-        skipped_rendering = 0  # 렌더링 건너뛴 글리프 (메트릭만 생성)
-        skipped_glyphs = []  # 건너뛴 글리프 정보 저장
-        processed_glyphs = []  # 렌더링 데이터 생성된 글리프
-        all_glyphs_with_metrics = []  # 메트릭이 있는 모든 글리프
-        
-        for i, glyph in enumerate(self.glyphs):
-            unicode = glyph['unicode']
+        # 라이브러리별 writer: 요소 조각을 만드는 즉시 파일에 씀 (블록을 나갈 때 닫는 태그와 함께 저장)
+        with contextlib.ExitStack() as stack:
+            def library(library_type):
+                path = os.path.join(output_dir, f'LIBRARY_{library_type}.xml')
+                return stack.enter_context(_LibraryWriter(path, library_type))
+            
+            lib_nefontmetrics = library('NEFONTMETRICS')
+            lib_neglyphmetrics = library('NEGLYPHMETRICS')
+            lib_node = library('NODE')
+            lib_renderinterfacebound = library('RENDERINTERFACEBOUND')
+            lib_segmentset = library('SEGMENTSET')
+            lib_shadergroup = library('SHADERGROUP')
+            lib_shaderinstance = library('SHADERINSTANCE')
+            
+            # ShaderGroup 생성
+            lib_shadergroup.write(self._create_shadergroup())
+            
+            # Shader 생성 (모든 글리프가 공유)
+            shader_id = self.font_name
+            lib_shaderinstance.write(self._create_shader(shader_id, self.texture_name))
             
-            # planeBounds가 없는 글리프 추적
-            has_planebounds = 'planeBounds' in glyph
-            if not has_planebounds:
-                skipped_rendering += 1
-                skipped_glyphs.append(glyph)
+            # ROOTNODE (모든 RENDERNODE의 부모)
+            lib_node.write(_ROOTNODE_HEAD)
+            # RENDERSTREAMINSTANCE의 shader 속성값 (글리프마다 이스케이프하지 않도록 한 번만)
+            shader_ref = _attr(f'#{shader_id}')
             
-            if i % 100 == 0:
-                print(f"진행 중: {i}/{len(self.glyphs)} 글리프 처리 중... (크기 0: {skipped_rendering}개)")
+            # 글리프별 스케일/간격 값, position/UV 경계와 버텍스 데이터 hex (한 번에 계산)
+            records = self._glyph_records()
+            scales = self._glyph_scales(records)
+            vertex_hex = self._vertex_data_hex(self._vertex_bounds(records, scales))
             
-            processed_glyphs.append(glyph)
-            all_glyphs_with_metrics.append(glyph)
+            # 각 글리프에 대해 데이터 생성
+            skipped_rendering = 0  # 렌더링 건너뛴 글리프 (메트릭만 생성)
+            skipped_codepoints = []  # 건너뛴 글리프의 코드포인트 (skipped_glyphs.txt용)
+            # NEFONTMETRICS는 모든 글리프를 참조하므로 같은 루프에서 참조 조각과 최대 advance를 모음
+            metrics_refs = []
+            max_advance = None
+            # share_geometry: 버텍스 데이터 hex -> 처음 그 데이터를 쓴 글리프의 RENDERDATASOURCE ID
+            shared_sources = {} if self.share_geometry else None
             
-            # ID 생성
-            datablock_id = self._generate_id("DB")
-            segment_id = self._generate_id("SEG")
-            datasource_id = self._generate_id("DS")
-            indexsource_id = self._generate_id("IS")
+            for i, record in enumerate(records):
+                unicode, advance, plane, _ = record
+                
+                # planeBounds가 없는 글리프 추적
+                if plane is None:
+                    skipped_rendering += 1
+                    skipped_codepoints.append(unicode)
+                
+                if not i & PROGRESS_MASK:
+                    print(f"진행 중: {i}/{len(self.glyphs)} 글리프 처리 중... (크기 0: {skipped_rendering}개)")
+                
+                # NEGLYPHMETRICSREF, 유효 advance width (h_scale, spacing_ratio 적용)
+                metrics_refs.append(f'\n<NEGLYPHMETRICSREF glyphMetricsRef="#glyphMetrics{unicode}" />')
+                hs, sr, sp_offset = scales[i]
+                advance = (0 if advance is None else advance) * hs * sr
+                if max_advance is None or advance > max_advance:
+                    max_advance = advance
+                
+                # ID 생성
+                datablock_id, segment_id, datasource_id, indexsource_id = self._glyph_ids(i)
+                
+                if shared_sources is not None and vertex_hex[i] in shared_sources:
+                    # 같은 버텍스 데이터가 이미 있으면 그 RENDERDATASOURCE를 참조만 함
+                    datasource_id = shared_sources[vertex_hex[i]]
+                else:
+                    if shared_sources is not None:
+                        shared_sources[vertex_hex[i]] = datasource_id
+                    
+                    # DATABLOCK 생성 및 추가 (planeBounds 없으면 크기 0)
+                    lib_renderinterfacebound.write(self._create_vertex_datablock(vertex_hex[i], datablock_id))
+                    
+                    # SEGMENTSET 생성 및 추가
+                    lib_segmentset.write(self._create_segmentset(record, datablock_id, segment_id,
+                                                                 datasource_id, indexsource_id))
+                
+                # RENDERNODE 생성 및 추가 (ROOTNODE의 자식으로)
+                lib_node.write(self._create_rendernode(record, datasource_id, shader_ref, hs, sp_offset))
+                
+                # NEGLYPHMETRICS 생성 및 추가
+                metrics = self._create_glyph_metrics(record, hs, sr, sp_offset)
+                if metrics is not None:
+                    lib_neglyphmetrics.write(metrics)
             
-            # DATABLOCK 생성 및 추가 (planeBounds 없으면 크기 0)
-            datablock = self._create_vertex_datablock(glyph, datablock_id)
-            lib_renderinterfacebound.append(datablock)
+            lib_node.write('\n</ROOTNODE>')
             
-            # SEGMENTSET 생성 및 추가
-            segmentset = self._create_segmentset(glyph, datablock_id, segment_id, 
-                                                  datasource_id, indexsource_id)
-            lib_segmentset.append(segmentset)
+            # FontMetrics 생성 (모든 글리프 포함, 글리프가 없으면 최대 advance 1.0)
+            scale = 1000
+            max_advance_scaled = int((1.0 if max_advance is None else max_advance) * scale)
             
-            # RENDERNODE 생성 및 추가 (ROOTNODE의 자식으로)
-            rendernode = self._create_rendernode(glyph, datasource_id, shader_id)
-            rootnode.append(rendernode)
+            fontmetrics = (f'\n<NEFONTMETRICS scale="{scale}" ascender="{int(self.ascender * scale)}" '
+                           f'descender="{int(self.descender * scale)}" maximumAdvanceWidth="{max_advance_scaled}" '
+                           f'numCharacters="{len(self.glyphs)}" hasKerningData="0" id="NeFontMetricsObj"')
             
-            # NEGLYPHMETRICS 생성 및 추가
-            metrics = self._create_glyph_metrics(glyph)
-            if metrics is not None:
-                lib_neglyphmetrics.append(metrics)
-        
-        # FontMetrics 생성 (모든 메트릭 글리프 포함)
-        scale = 1000
-        
-        # 최대 advance width 계산 (모든 글리프 포함)
-        def _eff_advance(g):
-            u = g['unicode']
-            hs = self._get_h_scale(u)
-            sr = self.spacing_ratio if (self.spacing_chars is None or u in self.spacing_chars) else 1.0
-            return g.get('advance', 0) * hs * sr
-
-        max_advance = max((_eff_advance(g) for g in all_glyphs_with_metrics), default=1.0)
-        max_advance_scaled = int(max_advance * scale)
-        
-        fontmetrics = ET.Element('NEFONTMETRICS')
-        fontmetrics.set('scale', str(scale))
-        fontmetrics.set('ascender', str(int(self.ascender * scale)))
-        fontmetrics.set('descender', str(int(self.descender * scale)))
-        fontmetrics.set('maximumAdvanceWidth', str(max_advance_scaled))
-        fontmetrics.set('numCharacters', str(len(all_glyphs_with_metrics)))
-        fontmetrics.set('hasKerningData', '0')
-        fontmetrics.set('id', 'NeFontMetricsObj')
-        
-        # all_glyphs_with_metrics의 각 글리프에 대해 NEGLYPHMETRICSREF 추가
-        for glyph in all_glyphs_with_metrics:
-            unicode = glyph['unicode']
-            metrics_ref = ET.SubElement(fontmetrics, 'NEGLYPHMETRICSREF')
-            metrics_ref.set('glyphMetricsRef', f'#glyphMetrics{unicode}')
-        
-        # FontMetrics를 라이브러리에 추가
-        lib_nefontmetrics.append(fontmetrics)
-        
-        # ROOTNODE를 NODE 라이브러리에 추가
-        lib_node.append(rootnode)
-        
-        # TEXTURE를 RENDERINTERFACEBOUND에 추가
-        texture = self._create_texture(self.texture_name)
-        lib_renderinterfacebound.append(texture)
-        
-        print(f"완료: 렌더링={len(processed_glyphs)}, 메트릭만={skipped_rendering}, 총={len(all_glyphs_with_metrics)}/{len(self.glyphs)}")
+            # FontMetrics를 라이브러리에 추가 (NEGLYPHMETRICSREF는 루프에서 모은 조각)
+            if metrics_refs:
+                lib_nefontmetrics.write(f'{fontmetrics}>{"".join(metrics_refs)}\n</NEFONTMETRICS>')
+            else:
+                lib_nefontmetrics.write(f'{fontmetrics} />')
+            
+            # TEXTURE를 RENDERINTERFACEBOUND에 추가
+            lib_renderinterfacebound.write(self._create_texture(self.texture_name))
+            
+            print(f"완료: 렌더링={len(self.glyphs)}, 메트릭만={skipped_rendering}, 총={len(self.glyphs)}/{len(self.glyphs)}")
         
         # 건너뛴 글리프 정보를 파일로 저장
-        if skipped_glyphs:
+        if skipped_codepoints:
             skipped_file = os.path.join(output_dir, 'skipped_glyphs.txt')
+            # 건너뛴 문자들을 한 줄로 표시 (유니코드 범위 밖은 [U+XXXX])
+            skipped_chars = [chr(cp) if 0 <= cp < 0x110000 else f"[U+{cp:04X}]"
+                             for cp in skipped_codepoints]
             with open(skipped_file, 'w', encoding='utf-8') as f:
-                # 건너뛴 문자들을 한 줄로 표시
-                skipped_chars = []
-                for glyph in skipped_glyphs:
-                    unicode_val = glyph['unicode']
-                    try:
-                        char = chr(unicode_val)
-                        skipped_chars.append(char)
-                    except (ValueError, OverflowError):
-                        skipped_chars.append(f"[U+{unicode_val:04X}]")
-                
-                # 한 줄로 출력
                 f.write(''.join(skipped_chars) + "\n")
                 
             print(f"\n건너뛴 글리프 정보: {skipped_file}")
         
-        # XML 파일로 저장 (알파벳 순서)
-        self._save_library(lib_nefontmetrics, os.path.join(output_dir, 'LIBRARY_NEFONTMETRICS.xml'))
-        self._save_library(lib_neglyphmetrics, os.path.join(output_dir, 'LIBRARY_NEGLYPHMETRICS.xml'))
-        self._save_library(lib_node, os.path.join(output_dir, 'LIBRARY_NODE.xml'))
-        self._save_library(lib_renderinterfacebound, os.path.join(output_dir, 'LIBRARY_RENDERINTERFACEBOUND.xml'))
-        self._save_library(lib_segmentset, os.path.join(output_dir, 'LIBRARY_SEGMENTSET.xml'))
-        self._save_library(lib_shadergroup, os.path.join(output_dir, 'LIBRARY_SHADERGROUP.xml'))
-        self._save_library(lib_shaderinstance, os.path.join(output_dir, 'LIBRARY_SHADERINSTANCE.xml'))
-        
         print("\n생성된 파일:")
         print(f"  - LIBRARY_NEFONTMETRICS.xml")
         print(f"  - LIBRARY_NEGLYPHMETRICS.xml")
@@ -441,86 +453,36 @@ class XMLGenerator:
         print(f"  - LIBRARY_SHADERINSTANCE.xml")
     
     def _create_shader(self, shader_id, texture_name):
-        """SHADERINSTANCE 생성"""
-        shader = ET.Element('SHADERINSTANCE')
-        shader.set('shaderGroup', '#ui_2d_uv_instanced.fx')
-        shader.set('parameterCount', '4')
-        shader.set('parameterSavedCount', '4')
-        shader.set('renderSortPriority', '0')
-        shader.set('id', shader_id)
-        
-        # SHADERINPUT 0: constant float4 (0,0,0,0)
-        shader_input0 = ET.SubElement(shader, 'SHADERINPUT')
-        shader_input0.set('parameterID', '0')
-        shader_input0.set('type', 'constant')
-        shader_input0.set('format', 'float4')
-        shader_input0.text = '\n0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 '
-        
-        # SHADERINPUT 1: texture
-        shader_input1 = ET.SubElement(shader, 'SHADERINPUT')
-        shader_input1.set('parameterID', '1')
-        shader_input1.set('type', 'texture')
-        shader_input1.set('texture', f'#{texture_name}')
-        
-        # SHADERINPUT 2: constant float4 (1,1,1,1)
-        shader_input2 = ET.SubElement(shader, 'SHADERINPUT')
-        shader_input2.set('parameterID', '2')
-        shader_input2.set('type', 'constant')
-        shader_input2.set('format', 'float4')
-        shader_input2.text = '\n1.000000000e+000 1.000000000e+000 1.000000000e+000 1.000000000e+000 '
-        
-        # SHADERINPUT 3: constant float (1.0)
-        shader_input3 = ET.SubElement(shader, 'SHADERINPUT')
-        shader_input3.set('parameterID', '3')
-        shader_input3.set('type', 'constant')
-        shader_input3.set('format', 'float')
-        shader_input3.text = '\n1.000000000e+000 '
-        
-        return shader
+        """SHADERINSTANCE XML 조각 생성"""
+        return (f'\n<SHADERINSTANCE shaderGroup="#ui_2d_uv_instanced.fx" parameterCount="4" '
+                f'parameterSavedCount="4" renderSortPriority="0" id="{_attr(shader_id)}">'
+                # SHADERINPUT 0: constant float4 (0,0,0,0)
+                '\n<SHADERINPUT parameterID="0" type="constant" format="float4">'
+                '\n0.000000000e+000 0.000000000e+000 0.000000000e+000 0.000000000e+000 </SHADERINPUT>'
+                # SHADERINPUT 1: texture
+                f'\n<SHADERINPUT parameterID="1" type="texture" texture="{_attr(f"#{texture_name}")}" />'
+                # SHADERINPUT 2: constant float4 (1,1,1,1)
+                '\n<SHADERINPUT parameterID="2" type="constant" format="float4">'
+                '\n1.000000000e+000 1.000000000e+000 1.000000000e+000 1.000000000e+000 </SHADERINPUT>'
+                # SHADERINPUT 3: constant float (1.0)
+                '\n<SHADERINPUT parameterID="3" type="constant" format="float">'
+                '\n1.000000000e+000 </SHADERINPUT>'
+                '\n</SHADERINSTANCE>')
     
     def _create_texture(self, texture_name):
-        """TEXTURE 요소 생성 (더미 4x4 DXT1 텍스처)"""
-        texture = ET.Element('TEXTURE')
-        texture.set('width', '4')
-        texture.set('height', '4')
-        texture.set('texelFormat', 'dxt1')
-        texture.set('transient', '0')
-        texture.set('wrapS', '1')
-        texture.set('wrapT', '1')
-        texture.set('wrapR', '1')
-        texture.set('minFilter', '5')
-        texture.set('magFilter', '1')
-        texture.set('gammaRemapR', '0')
-        texture.set('gammaRemapG', '0')
-        texture.set('gammaRemapB', '0')
-        texture.set('gammaRemapA', '0')
-        texture.set('automipmap', '0')
-        texture.set('numberMipMapLevels', '2')
-        texture.set('arraySize', '1')
-        texture.set('imageBlockCount', '1')
-        texture.set('id', texture_name)
-        
-        # TEXTUREIMAGEBLOCK (더미 데이터)
-        imageblock = ET.SubElement(texture, 'TEXTUREIMAGEBLOCK')
-        imageblock.set('typename', 'Raw')
-        imageblock.set('size', '24')
-        
-        imageblockdata = ET.SubElement(imageblock, 'TEXTUREIMAGEBLOCKDATA')
-        imageblockdata.text = '\n00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 '
-        
-        return texture
+        """TEXTURE XML 조각 생성 (더미 4x4 DXT1 텍스처)"""
+        return ('\n<TEXTURE width="4" height="4" texelFormat="dxt1" transient="0" wrapS="1" wrapT="1" wrapR="1" '
+                'minFilter="5" magFilter="1" gammaRemapR="0" gammaRemapG="0" gammaRemapB="0" gammaRemapA="0" '
+                f'automipmap="0" numberMipMapLevels="2" arraySize="1" imageBlockCount="1" id="{_attr(texture_name)}">'
+                # TEXTUREIMAGEBLOCK (더미 데이터)
+                '\n<TEXTUREIMAGEBLOCK typename="Raw" size="24">'
+                '\n<TEXTUREIMAGEBLOCKDATA>'
+                '\n00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 </TEXTUREIMAGEBLOCKDATA>'
+                '\n</TEXTUREIMAGEBLOCK>'
+                '\n</TEXTURE>')
     
     def _create_shadergroup(self):
-        """SHADERGROUP 생성"""
-        shadergroup = ET.Element('SHADERGROUP')
-        shadergroup.set('parameterCount', '4')
-        shadergroup.set('parameterSavedCount', '0')
-        shadergroup.set('parameterStreamCount', '0')
-        shadergroup.set('instancesRequireSorting', '0')
-        shadergroup.set('defaultRenderSortPriority', '-2147483648')
-        shadergroup.set('passCount', '0')
-        shadergroup.set('id', 'ui_2d_uv_instanced.fx')
-        
+        """SHADERGROUP XML 조각 생성"""
         # SHADERINPUTDEFINITION들
         inputs = [
             ('Phong', 'constant', 'float4'),
@@ -529,97 +491,44 @@ class XMLGenerator:
             ('Alpha', 'constant', 'float'),
         ]
         
+        parts = ['\n<SHADERGROUP parameterCount="4" parameterSavedCount="0" parameterStreamCount="0" '
+                 'instancesRequireSorting="0" defaultRenderSortPriority="-2147483648" passCount="0" '
+                 'id="ui_2d_uv_instanced.fx">']
         for name, input_type, format_type in inputs:
-            input_def = ET.SubElement(shadergroup, 'SHADERINPUTDEFINITION')
-            input_def.set('name', name)
-            input_def.set('type', input_type)
-            if format_type:
-                input_def.set('format', format_type)
-        
-        return shadergroup
+            format_attr = f' format="{format_type}"' if format_type else ''
+            parts.append(f'\n<SHADERINPUTDEFINITION name="{name}" type="{input_type}"{format_attr} />')
+        parts.append('\n</SHADERGROUP>')
+        return ''.join(parts)
     
-    def _create_glyph_metrics(self, glyph):
-        """NEGLYPHMETRICS 생성 (planeBounds 없는 경우도 처리)"""
-        unicode = glyph['unicode']
-        advance = glyph.get('advance', 1.0)
-        scale = 1000.0
-        
-        # 이 글자에 적용할 spacing_ratio 결정
-        sr = self.spacing_ratio if (
-            self.spacing_chars is None or unicode in self.spacing_chars
-        ) else 1.0
+    def _create_glyph_metrics(self, record, hs, sr, sp_offset):
+        """NEGLYPHMETRICS XML 조각 생성 (planeBounds 없는 경우도 처리)
 
-        # planeBounds가 없는 경우 (공백, 제어 문자 등)
-        if 'planeBounds' not in glyph:
-            metrics = ET.Element('NEGLYPHMETRICS')
-            hs = self._get_h_scale(unicode)
-            metrics.set('advanceWidth', str(int(advance * scale * hs * sr)))
-            metrics.set('horizontalBearing', '0')
-            metrics.set('verticalBearing', '0')
-            metrics.set('physicalWidth', '0')
-            metrics.set('physicalHeight', '0')
-            metrics.set('codePoint', str(unicode))
-            metrics.set('id', f'glyphMetrics{unicode}')
-            return metrics
-        
-        # planeBounds가 있는 경우
-        pb = glyph['planeBounds']
+        record: _glyph_records()의 한 항목
+        hs, sr, sp_offset: _glyph_scales()의 이 글리프 값 (sr: 이 글자에 적용할 spacing_ratio)
+        """
+        unicode, advance, plane, _ = record
+        if advance is None:
+            advance = 1.0
+        scale = 1000.0
         
-        hs = self._get_h_scale(unicode)
-        sp_offset = self._get_spacing_offset(glyph)
         advance_width = int(advance * scale * hs * sr)
-        physical_width = int((pb['right'] - pb['left']) * scale * hs)
-        physical_height = int((pb['top'] - pb['bottom']) * scale)
-        horizontal_bearing = int((pb['left'] * hs - sp_offset) * scale)
-        # verticalBearing: 베이스라인에서 글자 상단까지의 거리
-        vertical_bearing = int(pb['top'] * scale)
         
-        metrics = ET.Element('NEGLYPHMETRICS')
-        metrics.set('advanceWidth', str(advance_width))
-        metrics.set('horizontalBearing', str(horizontal_bearing))
-        metrics.set('verticalBearing', str(vertical_bearing))
-        metrics.set('physicalWidth', str(physical_width))
-        metrics.set('physicalHeight', str(physical_height))
-        metrics.set('codePoint', str(unicode))
-        metrics.set('id', f'glyphMetrics{unicode}')
-        
-        return metrics
-    
-    def _save_library(self, library_elem, filepath):
-        """LIBRARY를 XML 파일로 저장 (포맷팅 적용)"""
-        # 들여쓰기 추가 (Python 3.9+의 ET.indent 사용, 없으면 직접 구현)
-        try:
-            ET.indent(library_elem, space='', level=0)
-        except AttributeError:
-            # Python 3.8 이하용 대체 구현
-            self._indent(library_elem)
-        
-        # ET.tostring으로 변환
-        xml_string = ET.tostring(library_elem, encoding='unicode')
-        
-        # XML 선언 및 PSSG 구조 추가
-        full_xml = f'<?xml version=\'1.0\' encoding=\'utf-8\'?>\n<PSSGFILE version="1.0.0.0"><PSSGDATABASE>{xml_string}</PSSGDATABASE></PSSGFILE>'
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(full_xml)
-        
-        print(f"저장: {filepath}")
-    
-    def _indent(self, elem, level=0):
-        """XML 트리에 들여쓰기 추가 (ET.indent 대체용)"""
-        i = "\n" + level * ""
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + ""
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self._indent(child, level+1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
+        # planeBounds가 없는 경우 (공백, 제어 문자 등)
+        if plane is None:
+            horizontal_bearing = vertical_bearing = physical_width = physical_height = 0
         else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+            # planeBounds가 있는 경우
+            pb_left, pb_bottom, pb_right, pb_top = plane
+            
+            physical_width = int((pb_right - pb_left) * scale * hs)
+            physical_height = int((pb_top - pb_bottom) * scale)
+            horizontal_bearing = int((pb_left * hs - sp_offset) * scale)
+            # verticalBearing: 베이스라인에서 글자 상단까지의 거리
+            vertical_bearing = int(pb_top * scale)
+        
+        return (f'\n<NEGLYPHMETRICS advanceWidth="{advance_width}" horizontalBearing="{horizontal_bearing}" '
+                f'verticalBearing="{vertical_bearing}" physicalWidth="{physical_width}" '
+                f'physicalHeight="{physical_height}" codePoint="{unicode}" id="glyphMetrics{unicode}" />')
     
     def generate_summary(self):
         """JSON 데이터 요약 출력"""
@@ -675,11 +584,13 @@ Example:
     parser.add_argument('--texture', required=True, help='텍스처 파일명 (예: my_font_0.tga)')
     parser.add_argument('--font-name', required=True, help='폰트 이름 (예: my_font_msdf_0)')
     parser.add_argument('--summary', action='store_true', help='JSON 요약만 출력하고 종료')
+    parser.add_argument('--share-geometry', action='store_true',
+                        help='버텍스 데이터가 같은 글리프끼리 DATABLOCK/SEGMENTSET 공유')
     
     args = parser.parse_args()
     
     # Generator 생성
-    generator = XMLGenerator(args.json, args.texture, args.font_name)
+    generator = XMLGenerator(args.json, args.texture, args.font_name, share_geometry=args.share_geometry)
     
     if args.summary:
         # 요약만 출력
@@ -1,126 +1,185 @@
-import xml.etree.ElementTree as ET
 import os
+import re
+import mmap
+from xml.parsers import expat
+from xml.sax.saxutils import escape
 
-def indent_xml(elem, level=0, indent_str=""):
+# 속성값 이스케이프 (ElementTree 직렬화와 같은 결과)
+_ATTR_ENTITIES = {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#09;'}
+
+# <LIBRARY ...> 시작 위치 (LIBRARYXXX 같은 다른 태그는 제외)
+_LIBRARY_START = re.compile(rb'<LIBRARY[\s/>]')
+_LIBRARY_END = b'</LIBRARY>'
+
+_XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+
+WRITE_BUFFER_SIZE = 1 << 20   # 병합 파일 쓰기 버퍼 (헤더/구분 줄바꿈 같은 작은 조각을 모아 씀)
+
+class _TemplateHeaderFound(Exception):
+    """루트와 PSSGDATABASE 속성을 다 읽었을 때 expat 파싱을 멈추는 용도"""
+
+def load_order_template(template_path):
     """
-    XML 요소에 줄바꿈을 추가합니다 (들여쓰기는 없이).
-    Python 3.9 미만 버전에서 ET.indent 대체용입니다.
+    순서 기준 원본 XML에서 루트 태그/속성과 PSSGDATABASE 속성만 읽습니다
+    (호출 측에서 캐시해 재사용할 수 있음).
+    expat으로 앞부분만 읽다가 PSSGDATABASE 시작 태그에서 바로 멈추므로
+    템플릿 전체를 파싱하지 않습니다.
+    반환값: (root_tag, root_attrib, db_attrib)  - PSSGDATABASE가 없으면 db_attrib는 {}
     """
-    i = "\n" + level * indent_str
-    if len(elem):
-        if not elem.text or not elem.text.strip():
-            elem.text = i + indent_str
-        if not elem.tail or not elem.tail.strip():
-            elem.tail = i
-        for child in elem:
-            indent_xml(child, level + 1, indent_str)
-        if not child.tail or not child.tail.strip():
-            child.tail = i
-    else:
-        if level and (not elem.tail or not elem.tail.strip()):
-            elem.tail = i
-
-# --- 설정 ---
-import os
-from pathlib import Path
+    if not os.path.isfile(template_path):
+        raise FileNotFoundError(f"순서 기준 파일을 찾을 수 없습니다: {template_path}")
+    header = []
+    depth = 0
 
-# 작업 디렉토리 기준 경로 설정
-work_dir = Path(__file__).parent
+    def start(name, attrib):
+        nonlocal depth
+        depth += 1
+        if depth == 1:
+            header.extend((name, attrib))
+        elif depth == 2 and name == 'PSSGDATABASE':
+            header.append(attrib)
+            raise _TemplateHeaderFound
 
-# 1. 분리된 라이브러리 XML 파일들이 있는 폴더 경로
-INPUT_FOLDER = work_dir / "witchs_gift" / "generated_library"
+    def end(name):
+        nonlocal depth
+        depth -= 1
 
-# 2. 라이브러리 순서의 기준이 될 '원본' XML 파일 경로
-ORDER_TEMPLATE_XML_PATH = work_dir / "separated_libraries_raw" / "LIBRARY_NODE.xml"
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    with open(template_path, 'rb') as f:
+        try:
+            parser.ParseFile(f)
+        except _TemplateHeaderFound:
+            pass
+    if len(header) == 2:
+        header.append({})
+    return tuple(header)
 
-# 3. 하나로 합쳐진 최종 XML 파일을 저장할 경로
-OUTPUT_XML_PATH = work_dir / "witchs_gift" / "node.xml"
-# --- 설정 끝 ---
+def _start_tag(tag, attrib, close='>'):
+    """태그 이름과 속성으로 시작 태그 바이트를 만듭니다."""
+    attrs = ''.join(f' {k}="{escape(v, _ATTR_ENTITIES)}"' for k, v in attrib.items())
+    return f'<{tag}{attrs}{close}'.encode('utf-8')
 
-def merge_xml_libraries_ordered(input_dir, template_path, output_path):
+def read_library_bytes(file_path):
+    """
+    파일에서 <LIBRARY>...</LIBRARY> 구간을 바이트 그대로 잘라냅니다 (없으면 None).
+    생성된 라이브러리는 이미 병합 결과와 같은 형식(줄바꿈만, 들여쓰기 없음)이므로
+    파싱/재직렬화 없이 그대로 이어 붙일 수 있습니다.
+    읽기 전용 mmap에서 찾으므로 파일 전체가 아니라 잘라낸 구간만 복사됩니다.
+    """
+    with open(file_path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:   # mmap은 빈 파일을 매핑할 수 없음
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            match = _LIBRARY_START.search(data)
+            if match is None:
+                return None
+            start = match.start()
+            end = data.rfind(_LIBRARY_END)
+            if end > start:
+                return data[start:end + len(_LIBRARY_END)]
+            # 빈 라이브러리 (<LIBRARY type="..." />)
+            close = data.find(b'>', start)
+            if close != -1 and data[close - 1:close] == b'/':
+                return data[start:close + 1]
+            return None
+
+def _silent(*args):
+    pass
+
+def merge_xml_libraries_ordered(input_dir, template_path, output_path, template_tree=None, verbose=True):
     """
     'template_path'의 라이브러리 순서를 기준으로, 'input_dir' 폴더의
     모든 LIBRARY_*.xml 파일들을 하나의 PSSG XML 파일로 합칩니다.
+    경로는 str과 pathlib.Path 모두 받습니다.
+    template_tree: load_order_template()로 미리 읽은 (root_tag, root_attrib, db_attrib)
+                   (주어지면 템플릿 파일을 다시 읽지 않음)
+    verbose: False면 진행 상황 출력은 생략하고 경고/오류만 출력
+    템플릿이나 입력 폴더가 없으면 FileNotFoundError를 호출 측으로 그대로 올립니다.
     """
-    # Path 객체를 문자열로 변환
-    input_dir = str(input_dir)
-    template_path = str(template_path)
-    output_path = str(output_path)
+    log = print if verbose else _silent
+
+    log(f"--- XML 라이브러리 순서 보장 병합 시작 ---")
+    log(f"입력 폴더: {input_dir}")
+    log(f"순서 기준 파일: {template_path}")
+
+    # 1. 순서의 기준이 될 원본 XML 파일에서 XML 구조 가져오기
+    root_tag, root_attrib, db_attrib = template_tree if template_tree is not None else load_order_template(template_path)
     
-    print(f"--- XML 라이브러리 순서 보장 병합 시작 ---")
-    print(f"입력 폴더: {input_dir}")
-    print(f"순서 기준 파일: {template_path}")
-
-    try:
-        # 1. 순서의 기준이 될 원본 XML 파일에서 XML 구조 가져오기
-        order_tree = ET.parse(template_path)
-        order_root = order_tree.getroot()
-        order_db = order_root.find('PSSGDATABASE')
-        
-        # 2. 고정된 라이브러리 순서 (D:\msdf-atlas-gen\node.xml 원본 기준)
-        library_order = [
-            'NEFONTMETRICS',
-            'NEGLYPHMETRICS',
-            'SHADERINSTANCE',
-            'SHADERGROUP',
-            'SEGMENTSET',
-            'RENDERINTERFACEBOUND',
-            'NODE'
-        ]
-
-        print(f"라이브러리 순서 확인: {library_order}")
-        print("-" * 30)
-        
-        # 3. 합쳐질 기본 XML 구조 생성 (원본 속성을 그대로 복사)
-        root = ET.Element(order_root.tag, order_root.attrib)
-        database = ET.SubElement(root, order_db.tag, order_db.attrib if order_db is not None else {})
-
-        # 4. 고정된 순서에 따라 각 파일을 찾아 병합
-        print("병합을 시작합니다...")
-        for lib_type in library_order:
-            filename = f"LIBRARY_{lib_type}.xml"
-            file_path = os.path.join(input_dir, filename)
-
-            if os.path.exists(file_path):
-                try:
-                    tree = ET.parse(file_path)
-                    library_element = tree.find('.//LIBRARY')
-                    if library_element is not None:
-                        database.append(library_element)
-                        print(f"병합 완료: {filename}")
-                    else:
-                        print(f"[경고] '{filename}' 파일에서 <LIBRARY> 태그를 찾지 못해 건너뜁니다.")
-                except ET.ParseError:
-                    print(f"[오류] '{filename}' 파일이 올바른 XML 형식이 아닙니다. 건너뜁니다.")
-            else:
-                print(f"[경고] '{filename}' 파일을 찾을 수 없어 병합에서 제외합니다.")
-
-        # 5. 최종적으로 합쳐진 XML 파일 저장
-        final_tree = ET.ElementTree(root)
-        
-        # 들여쓰기 추가 (줄바꿈만, 들여쓰기 공백은 없음)
-        try:
-            # Python 3.9 이상
-            ET.indent(final_tree, space="", level=0)
-        except AttributeError:
-            # Python 3.9 미만에서는 수동으로 포맷팅
-            indent_xml(root, level=0, indent_str="")
-        
-        # XML 선언과 함께 파일로 저장
-        with open(output_path, 'wb') as f:
-            # standalone="yes" 속성을 포함한 XML 선언 작성
-            f.write(b'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n')
-            # 루트 요소부터 저장 (xml_declaration=False로 중복 선언 방지)
-            final_tree.write(f, encoding='utf-8', xml_declaration=False)
-
-        print("-" * 30)
-        print(f"성공! 원본 순서에 맞춰 '{output_path}' 파일로 병합했습니다.")
-
-    except FileNotFoundError:
-        print(f"[오류] '{input_dir}' 또는 '{template_path}' 파일을 찾을 수 없습니다.")
-    except Exception as e:
-        print(f"[오류] 오류 발생: {e}")
+    # 2. 고정된 라이브러리 순서 (D:\msdf-atlas-gen\node.xml 원본 기준)
+    library_order = [
+        'NEFONTMETRICS',
+        'NEGLYPHMETRICS',
+        'SHADERINSTANCE',
+        'SHADERGROUP',
+        'SEGMENTSET',
+        'RENDERINTERFACEBOUND',
+        'NODE'
+    ]
+
+    log(f"라이브러리 순서 확인: {library_order}")
+    log("-" * 30)
+    
+    # 3. 합쳐질 기본 XML 구조 (원본 루트/DB 속성을 그대로 복사)
+    libraries = []
+
+    # 4. 고정된 순서에 따라 각 파일을 찾아 병합 (폴더는 한 번만 나열)
+    log("병합을 시작합니다...")
+    with os.scandir(input_dir) as it:
+        entries = {e.name: e for e in it if e.name.startswith('LIBRARY_') and e.name.endswith('.xml')}
+    for lib_type in library_order:
+        filename = f"LIBRARY_{lib_type}.xml"
+        entry = entries.get(filename)
+
+        if entry is not None:
+            try:
+                library_bytes = read_library_bytes(entry.path)
+                if library_bytes is not None:
+                    libraries.append(library_bytes)
+                    log(f"병합 완료: {filename}")
+                else:
+                    print(f"[경고] '{filename}' 파일에서 <LIBRARY> 태그를 찾지 못해 건너뜁니다.")
+            except OSError:
+                print(f"[오류] '{filename}' 파일을 읽을 수 없습니다. 건너뜁니다.")
+        else:
+            print(f"[경고] '{filename}' 파일을 찾을 수 없어 병합에서 제외합니다.")
+
+    # 5. 최종적으로 합쳐진 XML 파일 저장 (라이브러리 구간을 줄바꿈으로 이어 붙임)
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        # standalone="yes" 속성을 포함한 XML 선언 작성
+        f.write(_XML_DECLARATION)
+        f.write(_start_tag(root_tag, root_attrib))
+        f.write(b'\n')
+        if libraries:
+            f.write(_start_tag('PSSGDATABASE', db_attrib))
+            for library_bytes in libraries:
+                f.write(b'\n')
+                f.write(library_bytes)
+            f.write(b'\n</PSSGDATABASE>')
+        else:
+            f.write(_start_tag('PSSGDATABASE', db_attrib, ' />'))
+        f.write(f'\n</{root_tag}>'.encode('utf-8'))
+
+    log("-" * 30)
+    log(f"성공! 원본 순서에 맞춰 '{output_path}' 파일로 병합했습니다.")
 
 # --- 스크립트 실행 ---
 if __name__ == '__main__':
+    # --- 설정 ---
+    from pathlib import Path
+
+    # 작업 디렉토리 기준 경로 설정
+    work_dir = Path(__file__).parent
+
+    # 1. 분리된 라이브러리 XML 파일들이 있는 폴더 경로
+    INPUT_FOLDER = work_dir / "witchs_gift" / "generated_library"
+
+    # 2. 라이브러리 순서의 기준이 될 '원본' XML 파일 경로
+    ORDER_TEMPLATE_XML_PATH = work_dir / "separated_libraries_raw" / "LIBRARY_NODE.xml"
+
+    # 3. 하나로 합쳐진 최종 XML 파일을 저장할 경로
+    OUTPUT_XML_PATH = work_dir / "witchs_gift" / "node.xml"
+    # --- 설정 끝 ---
+
     merge_xml_libraries_ordered(INPUT_FOLDER, ORDER_TEMPLATE_XML_PATH, OUTPUT_XML_PATH)
\ No newline at end of file